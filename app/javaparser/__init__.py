@@ -1,11 +1,29 @@
-from .ast import *
+from .ast import (
+    NodeType, Position,
+    ASTNode, Program, ClassDeclaration, MethodDeclaration, FieldDeclaration,
+    ConstructorDeclaration, VariableDeclaration, Parameter, Type, Block,
+    Identifier, Literal, BinaryOperation, UnaryOperation, TernaryOperation,
+    Assignment, MethodCall, ArrayCreation, ObjectCreation, ArrayAccess,
+    CastExpression, InstanceofExpression, ThisCall, SuperCall,
+    BreakStatement, ContinueStatement, DoWhileStatement, ForEachStatement,
+    ThrowStatement, TryStatement, CatchClause, SwitchStatement, SwitchCase,
+)
 from .parser import Parser
 from .errors import ParseError, UnexpectedTokenError
 
 __all__ = [
-    "Parser", 
-    "ParseError", 
+    "Parser",
+    "ParseError",
     "UnexpectedTokenError",
-    "ASTNode", "Program", "ClassDeclaration", "MethodDeclaration", 
-    "FieldDeclaration", "Type", "Identifier", "Literal", "BinaryOperation"
-]
\ No newline at end of file
+    "NodeType", "Position",
+    "ASTNode", "Program", "ClassDeclaration", "MethodDeclaration",
+    "FieldDeclaration", "ConstructorDeclaration", "VariableDeclaration",
+    "Parameter", "Type", "Block",
+    "Identifier", "Literal", "BinaryOperation", "UnaryOperation",
+    "TernaryOperation", "Assignment", "MethodCall",
+    "ArrayCreation", "ObjectCreation", "ArrayAccess",
+    "CastExpression", "InstanceofExpression", "ThisCall", "SuperCall",
+    "BreakStatement", "ContinueStatement", "DoWhileStatement",
+    "ForEachStatement", "ThrowStatement", "TryStatement", "CatchClause",
+    "SwitchStatement", "SwitchCase",
+]
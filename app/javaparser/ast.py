@@ -1,149 +1,244 @@
 from __future__ import annotations
+import sys
 from dataclasses import dataclass, field
-from typing import List, Optional
-from enum import Enum
+from enum import IntEnum, auto
 
 
-class NodeType(Enum):
-    # Программа и структура
-    PROGRAM = "Program"
-    CLASS_DECLARATION = "ClassDeclaration"
-    METHOD_DECLARATION = "MethodDeclaration"
-    FIELD_DECLARATION = "FieldDeclaration"
-    VARIABLE_DECLARATION = "VariableDeclaration"
-    TYPE = "Type"
-    BLOCK = "Block"
-    PARAMETER = "Parameter"
-    IMPORT = "Import"
-    PACKAGE = "Package"
+class NodeType(IntEnum):
+    """Тип узла AST.
+
+    Значения — маленькие целые, поэтому сравнения node_type — это сравнение
+    int, а не строк. Человекочитаемое имя для JSON даёт свойство `label`.
+    """
 
+    # Программа и структура
+    PROGRAM = auto()
+    CLASS_DECLARATION = auto()
+    METHOD_DECLARATION = auto()
+    FIELD_DECLARATION = auto()
+    VARIABLE_DECLARATION = auto()
+    TYPE = auto()
+    BLOCK = auto()
+    PARAMETER = auto()
+    IMPORT = auto()
+    PACKAGE = auto()
 
     # Выражения
-    EXPRESSION_STATEMENT = "ExpressionStatement"
-    ASSIGNMENT = "Assignment"
-    BINARY_OPERATION = "BinaryOperation"
-    TERNARY_OPERATION = "TernaryOperation"
-    UNARY_OPERATION = "UnaryOperation"
-    LITERAL = "Literal"
-    IDENTIFIER = "Identifier"
-    METHOD_CALL = "MethodCall"
-    FIELD_ACCESS = "FieldAccess"
-    ARRAY_CREATION = "ArrayCreation"      # NEW!
-    OBJECT_CREATION = "ObjectCreation"    # NEW!
-    ARRAY_ACCESS = "ArrayAccess"          # NEW! (для arr[i])
-    CONSTRUCTOR_DECLARATION = "ConstructorDeclaration"
-    THIS_CALL = "ThisCall"       # this(args)
-    SUPER_CALL = "SuperCall"     # super(args)
-    CAST_EXPRESSION = "CastExpression"
+    EXPRESSION_STATEMENT = auto()
+    ASSIGNMENT = auto()
+    BINARY_OPERATION = auto()
+    TERNARY_OPERATION = auto()
+    UNARY_OPERATION = auto()
+    LITERAL = auto()
+    IDENTIFIER = auto()
+    METHOD_CALL = auto()
+    FIELD_ACCESS = auto()
+    ARRAY_CREATION = auto()
+    OBJECT_CREATION = auto()
+    ARRAY_ACCESS = auto()     # для arr[i]
+    CONSTRUCTOR_DECLARATION = auto()
+    THIS_CALL = auto()        # this(args)
+    SUPER_CALL = auto()       # super(args)
+    CAST_EXPRESSION = auto()
 
     # Управляющие конструкции
-    THROW_STATEMENT = "ThrowStatement"
-    INSTANCEOF_EXPRESSION = "InstanceofExpression"
-    IF_STATEMENT = "IfStatement"
-    WHILE_STATEMENT = "WhileStatement"
-    DO_WHILE_STATEMENT = "DoWhileStatement"
-    FOR_STATEMENT = "ForStatement"
-    FOR_EACH_STATEMENT = "ForEachStatement"
-    RETURN_STATEMENT = "ReturnStatement"
-    BREAK_STATEMENT = "BreakStatement"
-    CONTINUE_STATEMENT = "ContinueStatement"
-    TRY_STATEMENT = "TryStatement"
-    CATCH_CLAUSE = "CatchClause"
-    SWITCH_STATEMENT = "SwitchStatement"
-    SWITCH_CASE = "SwitchCase"
-@dataclass
+    THROW_STATEMENT = auto()
+    INSTANCEOF_EXPRESSION = auto()
+    IF_STATEMENT = auto()
+    WHILE_STATEMENT = auto()
+    DO_WHILE_STATEMENT = auto()
+    FOR_STATEMENT = auto()
+    FOR_EACH_STATEMENT = auto()
+    RETURN_STATEMENT = auto()
+    BREAK_STATEMENT = auto()
+    CONTINUE_STATEMENT = auto()
+    TRY_STATEMENT = auto()
+    CATCH_CLAUSE = auto()
+    SWITCH_STATEMENT = auto()
+    SWITCH_CASE = auto()
+
+    @property
+    def label(self) -> str:
+        """CamelCase-имя узла для сериализации (как раньше .value)."""
+        return NODE_TYPE_LABELS[self]
+
+
+NODE_TYPE_LABELS = {
+    member: "".join(part.capitalize() for part in member.name.split("_"))
+    for member in NodeType
+}
+
+# Фиксированный набор модификаторов Java, которые понимает парсер.
+# Интернированные строки во frozenset: проверка «лексема — модификатор?»
+# идёт по готовому хешу и чаще всего завершается сравнением указателей.
+MODIFIERS: frozenset = frozenset(map(sys.intern, (
+    "public", "private", "protected", "static", "final", "abstract",
+)))
+
+
+@dataclass(frozen=True, slots=True)
 class Position:
     line: int
     column: int
 
+    @classmethod
+    def get(cls, line: int, column: int) -> Position:
+        """Вернуть закешированную позицию.
+
+        Соседние узлы почти всегда делят одну (line, column), так что кеш
+        убирает подавляющее большинство аллокаций Position.
+        """
+        key = (line, column)
+        pos = _POS_CACHE.get(key)
+        if pos is None:
+            if len(_POS_CACHE) > 1 << 16:
+                _POS_CACHE.clear()
+            pos = _POS_CACHE[key] = cls(line, column)
+        return pos
+
+
+_POS_CACHE: dict = {}
+
 
-@dataclass
+# Общий пустой кортеж вместо пустого списка: у листовых узлов (Identifier,
+# Literal, ...) дети так и не появляются, и список им не нужен.
+_EMPTY: tuple = ()
+
+
+@dataclass(slots=True, eq=False)
 class ASTNode:
     """Базовый класс для всех узлов AST."""
     node_type: NodeType
     position: Position
-    children: List[ASTNode] = field(default_factory=list)
+    children: list[ASTNode] = _EMPTY
     name: str = ""
+    # Кеш результатов визитеров (разрешённые типы и т.п.); лежит на самом
+    # узле — обращение к слоту заметно дешевле внешней хеш-таблицы.
+    _memo: dict | None = field(default=None, repr=False)
+
+    def __post_init__(self):
+        # Имена повторяются очень часто (this, int, i, ...) — интернируем,
+        # чтобы сравнения шли по указателю, а память не дублировалась.
+        if self.name:
+            self.name = sys.intern(self.name)
+
+    def memo(self, key, compute):
+        """Вернуть закешированный результат compute(node) по ключу key."""
+        cache = self._memo
+        if cache is None:
+            cache = self._memo = {}
+        if key in cache:
+            return cache[key]
+        value = cache[key] = compute(self)
+        return value
 
     def add_child(self, child: ASTNode):
         if child is not None:
-            self.children.append(child)
+            # Список материализуется только при первом добавлении
+            if type(self.children) is tuple:
+                self.children = [child]
+            else:
+                self.children.append(child)
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Identifier(ASTNode):
     """Идентификатор."""
     pass
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Type(ASTNode):
     """Тип данных."""
     is_array: bool = False
-    generic_types: List[Type] = field(default_factory=list)
+    generic_types: list[Type] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Literal(ASTNode):
     """Литерал."""
     value: str = ""
     literal_type: str = ""
 
+    def __post_init__(self):
+        ASTNode.__post_init__(self)
+        if self.literal_type:
+            self.literal_type = sys.intern(self.literal_type)
 
-@dataclass
+
+@dataclass(slots=True, eq=False)
 class BinaryOperation(ASTNode):
     """Бинарная операция."""
     operator: str = ""
-    left: Optional[ASTNode] = None
-    right: Optional[ASTNode] = None
+    left: ASTNode | None = None
+    right: ASTNode | None = None
+
+    def __post_init__(self):
+        ASTNode.__post_init__(self)
+        if self.operator:
+            self.operator = sys.intern(self.operator)
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class TernaryOperation(ASTNode):
     """Тернарная операция."""
-    condition: Optional[ASTNode] = None
-    then_expr: Optional[ASTNode] = None
-    else_expr: Optional[ASTNode] = None
+    condition: ASTNode | None = None
+    then_expr: ASTNode | None = None
+    else_expr: ASTNode | None = None
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class UnaryOperation(ASTNode):
     """Унарная операция."""
     operator: str = ""
-    operand: Optional[ASTNode] = None
+    operand: ASTNode | None = None
     is_postfix: bool = False
 
+    def __post_init__(self):
+        ASTNode.__post_init__(self)
+        if self.operator:
+            self.operator = sys.intern(self.operator)
 
-@dataclass
+
+@dataclass(slots=True, eq=False)
 class Assignment(ASTNode):
     """Присваивание."""
     operator: str = "="
-    variable: Optional[ASTNode] = None
-    value: Optional[ASTNode] = None
+    variable: ASTNode | None = None
+    value: ASTNode | None = None
+
+    def __post_init__(self):
+        ASTNode.__post_init__(self)
+        self.operator = sys.intern(self.operator)
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class MethodCall(ASTNode):
     """Вызов метода."""
     method_name: str = ""
-    arguments: List[ASTNode] = field(default_factory=list)
-    target: Optional[ASTNode] = None
+    arguments: list[ASTNode] = field(default_factory=list)
+    target: ASTNode | None = None
+
+    def __post_init__(self):
+        ASTNode.__post_init__(self)
+        if self.method_name:
+            self.method_name = sys.intern(self.method_name)
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Parameter(ASTNode):
     """Параметр метода."""
-    param_type: Optional[Type] = None
+    param_type: Type | None = None
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class VariableDeclaration(ASTNode):
     """Объявление переменной."""
-    var_type: Optional[Type] = None
-    value: Optional[ASTNode] = None
-    modifiers: List[str] = field(default_factory=list)
+    var_type: Type | None = None
+    value: ASTNode | None = None
+    modifiers: tuple[str, ...] = ()
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class SwitchCase(ASTNode):
     """Один case в switch.
     
@@ -153,12 +248,12 @@ class SwitchCase(ASTNode):
         case MyEnum.VALUE:
         default:
     """
-    case_label: Optional[ASTNode] = None  # выражение case (None для default)
-    statements: List[ASTNode] = field(default_factory=list)
+    case_label: ASTNode | None = None  # выражение case (None для default)
+    statements: list[ASTNode] = field(default_factory=list)
     is_default: bool = False
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class SwitchStatement(ASTNode):
     """Оператор switch.
     
@@ -168,27 +263,27 @@ class SwitchStatement(ASTNode):
             default: ...
         }
     """
-    expression: Optional[ASTNode] = None  # выражение в switch(...)
-    cases: List[SwitchCase] = field(default_factory=list)
-@dataclass
+    expression: ASTNode | None = None  # выражение в switch(...)
+    cases: list[SwitchCase] = field(default_factory=list)
+@dataclass(slots=True, eq=False)
 class FieldDeclaration(ASTNode):
     """Объявление поля класса."""
-    field_type: Optional[Type] = None
-    value: Optional[ASTNode] = None
-    modifiers: List[str] = field(default_factory=list)
+    field_type: Type | None = None
+    value: ASTNode | None = None
+    modifiers: tuple[str, ...] = ()
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class CatchClause(ASTNode):
     """Блок catch.
     
     Пример: catch (IOException e) { ... }
     """
-    exception_type: Optional[Type] = None      # тип исключения (IOException)
+    exception_type: Type | None = None      # тип исключения (IOException)
     exception_name: str = ""                    # имя переменной (e)
-    body: Optional[Block] = None               # тело catch
+    body: Block | None = None               # тело catch
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class TryStatement(ASTNode):
     """Оператор try-catch-finally.
     
@@ -197,134 +292,134 @@ class TryStatement(ASTNode):
         catch (IOException e) { ... } 
         finally { ... }
     """
-    try_block: Optional[Block] = None          # блок try
-    catch_clauses: List[CatchClause] = field(default_factory=list)  # список catch
-    finally_block: Optional[Block] = None      # блок finally (опционально)
+    try_block: Block | None = None          # блок try
+    catch_clauses: list[CatchClause] = field(default_factory=list)  # список catch
+    finally_block: Block | None = None      # блок finally (опционально)
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Block(ASTNode):
     """Блок кода."""
-    statements: List[ASTNode] = field(default_factory=list)
+    statements: list[ASTNode] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class MethodDeclaration(ASTNode):
     """Объявление метода."""
-    return_type: Optional[Type] = None
-    parameters: List[Parameter] = field(default_factory=list)
-    body: Optional[Block] = None
-    modifiers: List[str] = field(default_factory=list)
-    throws: List[Type] = field(default_factory=list)  # NEW!
+    return_type: Type | None = None
+    parameters: list[Parameter] = field(default_factory=list)
+    body: Block | None = None
+    modifiers: tuple[str, ...] = ()
+    throws: list[Type] = field(default_factory=list)  # NEW!
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class ClassDeclaration(ASTNode):
     """Объявление класса."""
-    modifiers: List[str] = field(default_factory=list)
-    extends: Optional[str] = None
-    implements: List[str] = field(default_factory=list)
-    fields: List[FieldDeclaration] = field(default_factory=list)
-    methods: List[MethodDeclaration] = field(default_factory=list)
-    constructors: List['ConstructorDeclaration'] = field(default_factory=list)  # NEW!
+    modifiers: tuple[str, ...] = ()
+    extends: str | None = None
+    implements: tuple[str, ...] = ()
+    fields: list[FieldDeclaration] = field(default_factory=list)
+    methods: list[MethodDeclaration] = field(default_factory=list)
+    constructors: list[ConstructorDeclaration] = field(default_factory=list)  # NEW!
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class BreakStatement(ASTNode):
     """Оператор break."""
-    label: Optional[str] = None
+    label: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class ContinueStatement(ASTNode):
     """Оператор continue."""
-    label: Optional[str] = None
+    label: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class DoWhileStatement(ASTNode):
     """Цикл do-while."""
     pass
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class ForEachStatement(ASTNode):
     """Цикл for-each."""
-    var_type: Optional[Type] = None
+    var_type: Type | None = None
     var_name: str = ""
-    iterable: Optional[ASTNode] = None
-    body: Optional[ASTNode] = None
+    iterable: ASTNode | None = None
+    body: ASTNode | None = None
 
 # ============ NEW CLASSES ============
-@dataclass
+@dataclass(slots=True, eq=False)
 class CastExpression(ASTNode):
     """Приведение типов: (String) obj"""
-    target_type: Optional[Type] = None    # тип к которому приводим
-    expression: Optional[ASTNode] = None  # выражение которое приводим
-@dataclass
+    target_type: Type | None = None    # тип к которому приводим
+    expression: ASTNode | None = None  # выражение которое приводим
+@dataclass(slots=True, eq=False)
 class ArrayCreation(ASTNode):
     """Создание массива: new int[5]"""
-    element_type: Optional[Type] = None
-    size: Optional[ASTNode] = None
+    element_type: Type | None = None
+    size: ASTNode | None = None
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class ObjectCreation(ASTNode):
     """Создание объекта: new MyClass(args)"""
-    class_type: Optional[Type] = None
-    arguments: List[ASTNode] = field(default_factory=list)
+    class_type: Type | None = None
+    arguments: list[ASTNode] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class ArrayAccess(ASTNode):
     """Доступ к элементу массива: arr[i]"""
-    array: Optional[ASTNode] = None
-    index: Optional[ASTNode] = None
+    array: ASTNode | None = None
+    index: ASTNode | None = None
 
 
 # ============ END NEW CLASSES ============
-@dataclass
+@dataclass(slots=True, eq=False)
 class ThrowStatement(ASTNode):
     """Оператор throw: throw new Exception("error");"""
-    expression: Optional[ASTNode] = None
+    expression: ASTNode | None = None
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class ConstructorDeclaration(ASTNode):
     """Объявление конструктора.
     
     Пример: public Person(String name) { this.name = name; }
     """
     name: str = ""                              # имя класса (Person)
-    parameters: List['Parameter'] = field(default_factory=list)
-    body: Optional['Block'] = None
-    modifiers: List[str] = field(default_factory=list)  # public, private, protected
-    throws: List['Type'] = field(default_factory=list)  # throws IOException
+    parameters: list['Parameter'] = field(default_factory=list)
+    body: 'Block' | None = None
+    modifiers: tuple[str, ...] = ()  # public, private, protected
+    throws: list['Type'] = field(default_factory=list)  # throws IOException
 
 
-@dataclass  
+@dataclass(slots=True, eq=False)
 class ThisCall(ASTNode):
     """Вызов другого конструктора этого класса.
     
     Пример: this(arg1, arg2);
     """
-    arguments: List[ASTNode] = field(default_factory=list)
+    arguments: list[ASTNode] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class SuperCall(ASTNode):
     """Вызов конструктора родительского класса.
     
     Пример: super(arg1, arg2);
     """
-    arguments: List[ASTNode] = field(default_factory=list)
+    arguments: list[ASTNode] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class InstanceofExpression(ASTNode):
     """Проверка типа: obj instanceof String"""
-    expression: Optional[ASTNode] = None  # левая часть (obj)
-    check_type: Optional[Type] = None      # правая часть (String)
-@dataclass
+    expression: ASTNode | None = None  # левая часть (obj)
+    check_type: Type | None = None      # правая часть (String)
+@dataclass(slots=True, eq=False)
 class Program(ASTNode):
     """Корневой узел программы."""
-    package: Optional[str] = None
-    imports: List[str] = field(default_factory=list)
-    classes: List[ClassDeclaration] = field(default_factory=list)
+    package: str | None = None
+    imports: tuple[str, ...] = ()
+    classes: list[ClassDeclaration] = field(default_factory=list)
@@ -1,12 +1,31 @@
 class ParseError(Exception):
+    """Ошибка синтаксического разбора.
+
+    Текст форматируется лениво в __str__: парсер создаёт исключения и при
+    спекулятивных разборах, где сообщение никто не читает.
+    """
+    __slots__ = ("message", "line", "column")
+
     def __init__(self, message: str, line: int, column: int):
-        super().__init__(f"[{line}:{column}] {message}")
+        super().__init__()
+        self.message = message
         self.line = line
         self.column = column
-        self.message = message
+
+    def __str__(self) -> str:
+        return f"[{self.line}:{self.column}] {self.message}"
+
 
 class UnexpectedTokenError(ParseError):
+    __slots__ = ("expected", "actual")
+
     def __init__(self, expected: str, actual: str, line: int, column: int):
-        super().__init__(f"Ожидался {expected}, но получен {actual}", line, column)
+        Exception.__init__(self)
         self.expected = expected
-        self.actual = actual
\ No newline at end of file
+        self.actual = actual
+        self.line = line
+        self.column = column
+
+    @property
+    def message(self) -> str:
+        return f"Ожидался {self.expected}, но получен {self.actual}"
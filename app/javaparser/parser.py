@@ -1,5 +1,6 @@
 from __future__ import annotations
 import logging
+import sys
 from typing import List, Optional
 from .ast import (
     ASTNode, Program, ClassDeclaration, MethodDeclaration, FieldDeclaration,
@@ -9,20 +10,71 @@ from .ast import (
     ForEachStatement, ArrayCreation, ObjectCreation, ArrayAccess,
     ThrowStatement, InstanceofExpression, TryStatement, CatchClause,
     ConstructorDeclaration, ThisCall, SuperCall, CastExpression, 
-    SwitchStatement, SwitchCase  # NEW!
+    SwitchStatement, SwitchCase, MODIFIERS  # NEW!
 )
 
 from .errors import ParseError, UnexpectedTokenError
 
 logger = logging.getLogger(__name__)
 
+# Интернированные типы токенов: лексер присылает эти строки в каждом
+# токене, интернирование обеих сторон сводит сравнение в _match/_expect
+# к проверке идентичности указателей.
+_KW = sys.intern("KEYWORD")
+_IDENT = sys.intern("IDENTIFIER")
+_SEP = sys.intern("SEPARATOR")
+_OP = sys.intern("OPERATOR")
+_EOF = sys.intern("EOF")
+
+# Наборы операторов по уровням приоритета: модульные frozenset вместо
+# списков-литералов, пересобираемых на каждой итерации разбора.
+_ASSIGN_OPS = frozenset(("=", "+=", "-=", "*=", "/="))
+_EQ_OPS = frozenset(("==", "!="))
+_REL_OPS = frozenset(("<", ">", "<=", ">="))
+_ADD_OPS = frozenset(("+", "-"))
+_MUL_OPS = frozenset(("*", "/", "%"))
+_UNARY_OPS = frozenset(("!", "-", "++", "--"))
+_INCDEC_OPS = frozenset(("++", "--"))
+
+# Таблица приоритетов бинарных операторов для precedence climbing;
+# больше число — сильнее связывание. instanceof живёт на уровне сравнений.
+_BINOP_PREC = {"||": 1, "&&": 2}
+for _ops, _prec in ((_EQ_OPS, 3), (_REL_OPS, 4), (_ADD_OPS, 5), (_MUL_OPS, 6)):
+    for _o in _ops:
+        _BINOP_PREC[_o] = _prec
+del _ops, _prec, _o
+_INSTANCEOF_PREC = 4
+
+# Примитивные типы Java и допустимые продолжения после ')' кастов
+_PRIMITIVE_TYPES = frozenset(("int", "long", "double", "float", "boolean",
+                              "char", "byte", "short"))
+_CAST_FOLLOW_TYPES = frozenset(("IDENTIFIER", "INT_LITERAL", "FLOAT_LITERAL",
+                                "STRING_LITERAL", "CHAR_LITERAL"))
+_CAST_FOLLOW_LEX = frozenset(("(", "!", "-", "++", "--", "new", "this", "super"))
+_CAST_FOLLOW_KW = frozenset(("new", "this", "super", "true", "false", "null"))
+
+# Тип токена-литерала -> literal_type узла; вычислено один раз вместо
+# lower().replace() на каждый литерал
+_LITERAL_KIND = {
+    sys.intern(t): sys.intern(t[:-8].lower())
+    for t in ("INT_LITERAL", "FLOAT_LITERAL", "STRING_LITERAL",
+              "CHAR_LITERAL", "BOOLEAN_LITERAL", "NULL_LITERAL")
+}
+
 
 class Token:
+    """Ленивая обёртка токена для сообщений об ошибках и отладки.
+
+    Горячий путь парсера работает с параллельными массивами (SoA) и не
+    создаёт этих объектов.
+    """
+    __slots__ = ("type", "lexeme", "line", "column")
+
     def __init__(self, type: str, lexeme: str, line: int, column: int):
         self.type = type
         self.lexeme = lexeme
         self.line = line
-        self.column = int(column)
+        self.column = column
 
     def __repr__(self):
         return f"Token({self.type}, '{self.lexeme}', {self.line}:{self.column})"
@@ -31,6 +83,19 @@ class Token:
 class Parser:
     """Базовый парсер Java, поддерживающий основные конструкции языка."""
     
+    # Статические объявления атрибутов: подсказка читателю и компилятору
+    # (mypyc/Cython превращают такие поля в типизированные C-слоты).
+    types: list[str]
+    lexemes: list[str]
+    lines: list[int]
+    columns: list[int]
+    n: int
+    pos: int
+    debug: bool
+    is_mod: bytes
+    is_assign: bytes
+    _type_memo: dict
+    
     def __init__(self, tokens: List[dict], debug: bool = False):
         """Инициализация парсера.
         
@@ -38,27 +103,53 @@ class Parser:
             tokens: Список токенов в формате {type, lexeme, line, column}
             debug: Включить отладочный вывод
         """
+        # Structure-of-Arrays: четыре параллельных списка вместо объекта
+        # на токен. Горячие проверки читают types/lexemes по индексу, без
+        # PyObject-заголовка и словаря атрибутов на каждый токен.
         try:
-            self.tokens = [Token(**t) for t in tokens]
+            self.types = [sys.intern(t["type"]) for t in tokens]
+            self.lexemes = [sys.intern(t["lexeme"]) for t in tokens]
+            self.lines = [t["line"] for t in tokens]
+            self.columns = [int(t["column"]) for t in tokens]
         except (TypeError, KeyError) as e:
             raise ValueError(f"Неверный формат токена: {e}") from e
         
+        # Сентинел EOF: лишний слот в конце массивов позволяет горячим
+        # проверкам читать types[pos] без контроля границ — pos никогда
+        # не продвигается дальше сентинела. Позиция (1, 1) сохраняет
+        # прежний текст ошибок "ожидался X, получен EOF".
+        self.types.append(_EOF)
+        self.lexemes.append("")
+        self.lines.append(1)
+        self.columns.append(1)
+        
+        self.n = len(self.types) - 1
         self.pos = 0
-        self.current_token = self.tokens[0] if tokens else None
         self.debug = debug
+        # Битовая карта «токен — модификатор»: _parse_modifiers крутится
+        # по одному байтовому индексу вместо двух сравнений строк.
+        # Сентинел в конце — всегда 0.
+        self.is_mod = bytes(
+            1 if (t is _KW and l in MODIFIERS) else 0
+            for t, l in zip(self.types, self.lexemes)
+        )
+        # Аналогичная карта «токен — оператор присваивания»: проверка на
+        # границе каждого выражения сводится к одному байтовому индексу.
+        self.is_assign = bytes(
+            1 if (t is _OP and l in _ASSIGN_OPS) else 0
+            for t, l in zip(self.types, self.lexemes)
+        )
+        # Packrat-кеш разбора типов: позиция -> (узел, новая позиция)
+        self._type_memo = {}
 
     # ==================== Вспомогательные методы ====================
 
     def _advance(self):
         """Переход к следующему токену."""
-        if self.pos >= len(self.tokens) - 1:
-            self.pos = len(self.tokens)
-            self.current_token = None
-        else:
+        if self.pos < self.n:
             self.pos += 1
-            self.current_token = self.tokens[self.pos]
 
-    def _expect(self, token_type: str, value: str = None) -> Token:
+    def _expect(self, token_type: str, value: str = None) -> str:
         """Ожидание конкретного токена.
         
         Args:
@@ -66,48 +157,46 @@ class Parser:
             value: Ожидаемое значение (опционально)
             
         Returns:
-            Найденный токен
+            Лексема найденного токена
             
         Raises:
             UnexpectedTokenError: Если токен не соответствует ожиданиям
         """
-        if not self.current_token:
-            raise UnexpectedTokenError(token_type, "EOF", 1, 1)
-        
-        if self.current_token.type != token_type:
+        # На сентинеле types[i] — это _EOF с позицией (1, 1): несовпадение
+        # типов ниже даёт ровно прежнюю EOF-ошибку без отдельной ветки
+        i = self.pos
+        if self.types[i] != token_type:
             raise UnexpectedTokenError(
-                token_type, self.current_token.type,
-                self.current_token.line, self.current_token.column
+                token_type, self.types[i],
+                self.lines[i], self.columns[i]
             )
         
-        if value and self.current_token.lexeme != value:
+        lexeme = self.lexemes[i]
+        if value and lexeme != value:
             raise UnexpectedTokenError(
-                f"'{value}'", f"'{self.current_token.lexeme}'",
-                self.current_token.line, self.current_token.column
+                f"'{value}'", f"'{lexeme}'",
+                self.lines[i], self.columns[i]
             )
         
-        token = self.current_token
-        self._advance()
-        return token
+        self.pos = i + 1
+        return lexeme
 
     def _match(self, token_type: str, value: str = None) -> bool:
         """Проверка текущего токена без продвижения."""
-        if not self.current_token:
-            return False
-        if self.current_token.type != token_type:
-            return False
-        if value and self.current_token.lexeme != value:
+        # Сентинел в конце массивов делает проверку границ ненужной
+        i = self.pos
+        if self.types[i] != token_type:
             return False
-        return True
+        return value is None or self.lexemes[i] == value
 
     def _current_position(self) -> Position:
         """Получение текущей позиции в исходном коде."""
-        if self.current_token:
-            return Position(self.current_token.line, self.current_token.column)
-        if self.pos > 0 and self.pos <= len(self.tokens):
-            last_token = self.tokens[self.pos - 1]
-            return Position(last_token.line, last_token.column)
-        return Position(1, 1)
+        i = self.pos
+        if i < self.n:
+            return Position.get(self.lines[i], self.columns[i])
+        if 0 < i <= self.n:
+            return Position.get(self.lines[i - 1], self.columns[i - 1])
+        return Position.get(1, 1)
 
     def _save_position(self) -> int:
         """Сохранение текущей позиции для возможного отката."""
@@ -116,10 +205,12 @@ class Parser:
     def _restore_position(self, pos: int):
         """Восстановление позиции парсера."""
         self.pos = pos
-        if self.pos < len(self.tokens):
-            self.current_token = self.tokens[self.pos]
-        else:
-            self.current_token = None
+
+    def _token_at(self, i: int):
+        """Обернуть токен в Token — только для сообщений и отладки."""
+        if 0 <= i < self.n:
+            return Token(self.types[i], self.lexemes[i], self.lines[i], self.columns[i])
+        return None
 
     def _log(self, message: str):
         """Отладочный вывод."""
@@ -138,67 +229,72 @@ class Parser:
         """
         pos = self._current_position()
         program = Program(NodeType.PROGRAM, pos)
-        
-        self._log(f"Начало парсинга, токенов: {len(self.tokens)}")
-        
-        while self.current_token and self.current_token.type != "EOF":
-            # Импорты
-            if self._match("KEYWORD", "import"):
-                import_stmt = self._parse_import()
-                program.imports.append(import_stmt)
-                self._log(f"Добавлен импорт: {import_stmt}")
-            
-            # Классы
-            elif self._match("KEYWORD") and self.current_token.lexeme in self._get_modifiers_set():
-                class_decl = self._parse_class_declaration()
-                if class_decl:
-                    program.classes.append(class_decl)
-                    self._log(f"Добавлен класс: {class_decl.name}")
-            
-            elif self._match("KEYWORD", "class"):
-                class_decl = self._parse_class_declaration()
-                if class_decl:
-                    program.classes.append(class_decl)
-                    self._log(f"Добавлен класс: {class_decl.name}")
-            
+        imports = []
+
+        self._log(f"Начало парсинга, токенов: {self.n}")
+
+        top_level = self._TOP_LEVEL
+        while self.pos < self.n and self.types[self.pos] != _EOF:
+            # Один поиск в таблице вместо цепочки сравнений ключевых слов
+            handler = top_level.get(self.lexemes[self.pos]) if self.types[self.pos] is _KW else None
+            if handler is not None:
+                handler(self, program, imports)
             else:
                 # Пропускаем неизвестные токены
                 self._advance()
         
+        program.imports = tuple(sys.intern(i) for i in imports)
+
         self._log(f"Парсинг завершён: {len(program.classes)} классов, {len(program.imports)} импортов")
         return program
-    def _peek_token(self, offset: int = 1):
-        """Посмотреть токен на offset позиций вперёд без продвижения."""
-        peek_pos = self.pos + offset
-        if peek_pos < len(self.tokens):
-            return self.tokens[peek_pos]
-        return None
-
-
     def _parse_arguments(self) -> List[ASTNode]:
         """Парсинг аргументов вызова (без скобок).
         
         Grammar: args → expr (',' expr)*
+        
+        Единственный цикл аргументов: вызовы методов, this/super и new
+        используют его вместо трёх одинаковых циклов.
         """
         arguments = []
+        types = self.types
+        lexemes = self.lexemes
         
-        if self._match("SEPARATOR", ")"):
+        if types[self.pos] is _SEP and lexemes[self.pos] == ")":
             return arguments
         
+        append = arguments.append
         while True:
             arg = self._parse_expression()
             if arg:
-                arguments.append(arg)
+                append(arg)
             
-            if not self._match("SEPARATOR", ","):
+            i = self.pos
+            if types[i] is _SEP and lexemes[i] == ",":
+                self._advance()
+            else:
                 break
-            self._advance()
         
         return arguments
 
-    def _get_modifiers_set(self) -> set:
-        """Возвращает набор допустимых модификаторов."""
-        return {"public", "private", "protected", "static", "final", "abstract"}
+    def _parse_import_into(self, program: Program, imports: list):
+        """Обработчик 'import' для таблицы верхнего уровня."""
+        import_stmt = self._parse_import()
+        imports.append(import_stmt)
+        self._log(f"Добавлен импорт: {import_stmt}")
+
+    def _parse_class_into(self, program: Program, imports: list):
+        """Обработчик 'class' (и ведущих модификаторов)."""
+        class_decl = self._parse_class_declaration()
+        if class_decl:
+            program.classes.append(class_decl)
+            self._log(f"Добавлен класс: {class_decl.name}")
+
+    # Таблица диспетчеризации верхнего уровня: ключевое слово -> метод.
+    # Модификаторы тоже начинают объявление класса.
+    _TOP_LEVEL = {"import": _parse_import_into, "class": _parse_class_into}
+    for _m in MODIFIERS:
+        _TOP_LEVEL[_m] = _parse_class_into
+    del _m
 
     # ==================== Импорты ====================
 
@@ -208,32 +304,34 @@ class Parser:
         Grammar: import → 'import' qualifiedName ';'
                  qualifiedName → IDENTIFIER ('.' IDENTIFIER)* ('.' '*')?
         """
-        self._expect("KEYWORD", "import")
-        
-        parts = []
-        
+        self._expect(_KW, "import")
+
+        # Квалифицированное имя — подряд идущие токены; сканируем индекс
+        # и собираем имя одним join по срезу лексем, без списка частей.
+        types = self.types
+        lexemes = self.lexemes
+        start = i = self.pos
+
         # Первый идентификатор
-        if self._match("IDENTIFIER"):
-            parts.append(self.current_token.lexeme)
-            self._advance()
-        
+        if types[i] is _IDENT:
+            i += 1
+
         # Остальные части через точку
-        while self._match("SEPARATOR", "."):
-            parts.append(".")
-            self._advance()
-            
-            if self._match("OPERATOR", "*"):
-                parts.append("*")
-                self._advance()
+        while types[i] is _SEP and lexemes[i] == ".":
+            j = i + 1
+            if types[j] is _OP and lexemes[j] == "*":
+                i = j + 1
                 break
-            elif self._match("IDENTIFIER"):
-                parts.append(self.current_token.lexeme)
-                self._advance()
+            if types[j] is _IDENT:
+                i = j + 1
             else:
+                i = j
                 break
-        
-        self._expect("SEPARATOR", ";")
-        return "".join(parts)
+
+        self.pos = i
+        name = "".join(lexemes[start:i])
+        self._expect(_SEP, ";")
+        return name
 
     # ==================== Объявление класса ====================
 
@@ -251,10 +349,10 @@ class Parser:
         modifiers = self._parse_modifiers()
         
         # class
-        self._expect("KEYWORD", "class")
+        self._expect(_KW, "class")
         
         # Имя класса
-        class_name = self._expect("IDENTIFIER").lexeme
+        class_name = self._expect(_IDENT)
         
         class_decl = ClassDeclaration(
             node_type=NodeType.CLASS_DECLARATION,
@@ -264,39 +362,48 @@ class Parser:
         )
         
         # extends
-        if self._match("KEYWORD", "extends"):
+        if self._match(_KW, "extends"):
             self._advance()
-            parent_name = self._expect("IDENTIFIER").lexeme
-            extends_node = ASTNode(NodeType.IDENTIFIER, self._current_position(), name="extends")
-            extends_node.add_child(Type(NodeType.TYPE, self._current_position(), name=parent_name))
+            parent_name = self._expect(_IDENT)
+            extends_node = ASTNode(
+                NodeType.IDENTIFIER, self._current_position(), name="extends",
+                children=[Type(NodeType.TYPE, self._current_position(), name=parent_name)]
+            )
             class_decl.add_child(extends_node)
         
         # implements
-        if self._match("KEYWORD", "implements"):
+        if self._match(_KW, "implements"):
             self._advance()
-            interface_name = self._expect("IDENTIFIER").lexeme
-            implements_node = ASTNode(NodeType.IDENTIFIER, self._current_position(), name="implements")
-            implements_node.add_child(Type(NodeType.TYPE, self._current_position(), name=interface_name))
+            interface_name = self._expect(_IDENT)
+            implements_node = ASTNode(
+                NodeType.IDENTIFIER, self._current_position(), name="implements",
+                children=[Type(NodeType.TYPE, self._current_position(), name=interface_name)]
+            )
             class_decl.add_child(implements_node)
         
         # Тело класса
-        self._expect("SEPARATOR", "{")
+        self._expect(_SEP, "{")
         
-        while self.current_token and not self._match("SEPARATOR", "}"):
+        types = self.types
+        lexemes = self.lexemes
+        n = self.n
+        while self.pos < n and not (types[self.pos] is _SEP and lexemes[self.pos] == "}"):
             member = self._parse_class_member(class_name)
             if member:
-                if isinstance(member, FieldDeclaration):
+                # Сравнение тега — один указатель, без обхода MRO
+                kind = member.node_type
+                if kind is NodeType.FIELD_DECLARATION:
                     class_decl.fields.append(member)
-                elif isinstance(member, ConstructorDeclaration):  # NEW!
+                elif kind is NodeType.CONSTRUCTOR_DECLARATION:  # NEW!
                     class_decl.constructors.append(member)
-                elif isinstance(member, MethodDeclaration):
+                elif kind is NodeType.METHOD_DECLARATION:
                     class_decl.methods.append(member)
             else:
                 # Пропускаем непонятный токен
-                if self.current_token:
+                if self.pos < n:
                     self._advance()
         
-        self._expect("SEPARATOR", "}")
+        self._expect(_SEP, "}")
         
         self._log(f"Класс {class_name}: {len(class_decl.fields)} полей, {len(class_decl.methods)} методов")
         return class_decl
@@ -306,16 +413,20 @@ class Parser:
         
         Grammar: modifier* где modifier ∈ {public, private, protected, static, final}
         """
-        valid_modifiers = self._get_modifiers_set()
         modifiers = []
         
-        while (self.current_token and
-               self.current_token.type == "KEYWORD" and
-               self.current_token.lexeme in valid_modifiers):
-            modifiers.append(self.current_token.lexeme)
-            self._advance()
-        
-        return modifiers
+        is_mod = self.is_mod
+        lexemes = self.lexemes
+        pos = self.pos
+        # Лексемы интернированы в __init__ — узлы и так разделяют один
+        # объект "public"/"static"/...
+        while is_mod[pos]:
+            modifiers.append(lexemes[pos])
+            pos += 1
+        self.pos = pos
+
+        # Узлы не меняют модификаторы после построения — отдаём кортеж
+        return tuple(modifiers)
 
     # ==================== Члены класса ====================
 
@@ -323,6 +434,9 @@ class Parser:
         """Парсинг члена класса (поле, метод или конструктор).
         
         Grammar: memberDecl → fieldDecl | methodDecl | constructorDecl
+        
+        Вид члена определяется детерминированным просмотром на пару
+        токенов вперёд — без спекулятивного разбора типа с откатом.
         """
         start_pos = self._save_position()
         pos = self._current_position()
@@ -331,25 +445,41 @@ class Parser:
             # Модификаторы
             modifiers = self._parse_modifiers()
             
-            # Проверка на конструктор: ИмяКласса(
-            if self._match("IDENTIFIER", class_name):
-                next_pos = self.pos + 1
-                if next_pos < len(self.tokens) and self.tokens[next_pos].lexeme == "(":
-                    return self._parse_constructor(modifiers, class_name)
+            types = self.types
+            lexemes = self.lexemes
+            n = self.n
+            i = self.pos
             
-            # Тип возвращаемого значения / тип поля
-            member_type = self._parse_type()
+            # Конструктор: ИмяКласса(
+            if (i + 1 < n and types[i] is _IDENT and lexemes[i] == class_name
+                    and lexemes[i + 1] == "("):
+                return self._parse_constructor(modifiers, class_name)
             
-            # Имя метода / поля
-            if not self.current_token or self.current_token.type != "IDENTIFIER":
+            # Начало типа: ключевое слово или идентификатор
+            if i >= n or (types[i] is not _KW and types[i] is not _IDENT):
                 self._restore_position(start_pos)
                 return None
             
-            name = self.current_token.lexeme
-            self._advance()
+            # Конец типа: опциональная пара '[' ']'
+            j = i + 1
+            if j < n and types[j] is _SEP and lexemes[j] == "[":
+                if j + 1 >= n or lexemes[j + 1] != "]":
+                    self._restore_position(start_pos)
+                    return None
+                j += 2
+            
+            # После типа должно идти имя члена
+            if j >= n or types[j] is not _IDENT:
+                self._restore_position(start_pos)
+                return None
+            
+            # Форма члена известна — разбор уже не откатится
+            member_type = self._parse_type()
+            name = lexemes[j]
+            self.pos = j + 1
             
             # Метод: (
-            if self._match("SEPARATOR", "("):
+            if self._match(_SEP, "("):
                 return self._parse_method(pos, modifiers, member_type, name)
             
             # Поле: = или ;
@@ -370,16 +500,16 @@ class Parser:
         pos = self._current_position()  # <-- Получаем позицию ЗДЕСЬ
         
         # Имя конструктора (должно совпадать с именем класса)
-        name = self._expect("IDENTIFIER").lexeme
+        name = self._expect(_IDENT)
         
         # Параметры
-        self._expect("SEPARATOR", "(")
+        self._expect(_SEP, "(")
         parameters = self._parse_parameters()
-        self._expect("SEPARATOR", ")")
+        self._expect(_SEP, ")")
         
         # throws clause (опционально)
         throws = []
-        if self._match("KEYWORD", "throws"):
+        if self._match(_KW, "throws"):
             self._advance()
             throws = self._parse_throws_clause()  # <-- Используй _parse_throws_clause
         
@@ -414,11 +544,11 @@ class Parser:
         )
         
         # Инициализация
-        if self._match("OPERATOR", "="):
+        if self._match(_OP, "="):
             self._advance()
             field.value = self._parse_expression()
         
-        self._expect("SEPARATOR", ";")
+        self._expect(_SEP, ";")
         return field
 
     def _parse_parameters(self) -> List[Parameter]:
@@ -429,16 +559,20 @@ class Parser:
         """
         parameters = []
         
-        if self._match("SEPARATOR", ")"):
+        if self._match(_SEP, ")"):
             return parameters
         
+        types = self.types
+        lexemes = self.lexemes
+        
         while True:
             param_type = self._parse_type()
             
-            if not self.current_token or self.current_token.type != "IDENTIFIER":
+            i = self.pos
+            if types[i] is not _IDENT:
                 break
             
-            param_name = self.current_token.lexeme
+            param_name = lexemes[i]
             self._advance()
             
             param = Parameter(
@@ -449,9 +583,11 @@ class Parser:
             )
             parameters.append(param)
             
-            if not self._match("SEPARATOR", ","):
+            i = self.pos
+            if types[i] is _SEP and lexemes[i] == ",":
+                self._advance()
+            else:
                 break
-            self._advance()
         
         return parameters
 
@@ -464,31 +600,42 @@ class Parser:
                  primitiveType → 'int' | 'long' | 'double' | 'float' 
                                | 'boolean' | 'char' | 'byte' | 'short' | 'void'
         """
+        # Спекулятивные проверки (_is_variable_declaration, _is_for_each)
+        # разбирают тип по той же позиции, что и последующий настоящий
+        # разбор — кеш по pos выполняет работу один раз. Токены не
+        # меняются, так что записи не инвалидируются.
+        start = self.pos
+        cached = self._type_memo.get(start)
+        if cached is not None:
+            type_node, self.pos = cached
+            return type_node
+        
         pos = self._current_position()
         
-        if not self.current_token:
-            raise UnexpectedTokenError("тип", "EOF", 1, 1)
+        if start >= self.n:
+            raise UnexpectedTokenError("тип", _EOF, 1, 1)
         
         # Примитивы или идентификатор
-        if self.current_token.type in ["KEYWORD", "IDENTIFIER"]:
-            type_name = self.current_token.lexeme
+        if self.types[start] in [_KW, _IDENT]:
+            type_name = self.lexemes[start]
             self._advance()
         else:
             raise UnexpectedTokenError(
                 "тип",
-                self.current_token.type,
-                self.current_token.line,
-                self.current_token.column
+                self.types[start],
+                self.lines[start],
+                self.columns[start]
             )
         
         type_node = Type(NodeType.TYPE, pos, name=type_name)
         
         # Массив []
-        if self._match("SEPARATOR", "["):
+        if self._match(_SEP, "["):
             self._advance()
-            self._expect("SEPARATOR", "]")
+            self._expect(_SEP, "]")
             type_node.is_array = True
         
+        self._type_memo[start] = (type_node, self.pos)
         return type_node
 
     # ==================== Блок и инструкции ====================
@@ -499,17 +646,43 @@ class Parser:
         Grammar: block → '{' statement* '}'
         """
         pos = self._current_position()
-        self._expect("SEPARATOR", "{")
-        
-        block = Block(NodeType.BLOCK, pos)
+        self._expect(_SEP, "{")
+        
+        # Оценка числа инструкций одним проходом до парной '}': считаем ';'
+        # и '{' верхнего уровня. Верхняя граница позволяет выделить список
+        # сразу нужного размера и не платить за геометрические реаллокации.
+        estimate = 0
+        depth = 1
+        types = self.types
+        lexemes = self.lexemes
+        i = self.pos
+        n_tokens = self.n
+        while i < n_tokens and depth:
+            if types[i] == _SEP:
+                lex = lexemes[i]
+                if lex == "{":
+                    if depth == 1:
+                        estimate += 1
+                    depth += 1
+                elif lex == "}":
+                    depth -= 1
+                elif lex == ";" and depth == 1:
+                    estimate += 1
+            i += 1
+        
+        statements = [None] * estimate
+        count = 0
         
         # Защита от зацикливания
         max_iterations = 10000
         iteration = 0
         
-        while not self._match("SEPARATOR", "}"):
-            if not self.current_token:
+        while True:
+            p = self.pos
+            if p >= n_tokens:
                 raise ParseError("Незакрытый блок", pos.line, pos.column)
+            if types[p] is _SEP and lexemes[p] == "}":
+                break
             
             # Защита от бесконечного цикла
             iteration += 1
@@ -517,86 +690,58 @@ class Parser:
                 raise ParseError("Слишком много итераций при парсинге блока", pos.line, pos.column)
             
             # Запоминаем позицию до парсинга
-            pos_before = self.pos
+            pos_before = p
             
             stmt = self._parse_statement()
             if stmt:
-                block.statements.append(stmt)
+                if count < estimate:
+                    statements[count] = stmt
+                else:
+                    statements.append(stmt)
+                count += 1
             
             # Если позиция не изменилась — пропускаем токен, чтобы избежать зацикливания
             if self.pos == pos_before:
-                self._log(f"Пропуск токена для избежания зацикливания: {self.current_token}")
+                self._log(f"Пропуск токена для избежания зацикливания: {self._token_at(self.pos)}")
                 self._advance()
         
-        self._expect("SEPARATOR", "}")
-        return block
+        self._expect(_SEP, "}")
+        del statements[count:]
+        return Block(NodeType.BLOCK, pos, statements=statements)
 
 
     def _parse_statement(self):
         """Парсинг инструкции."""
-        if not self.current_token:
-            return None
-        
-        # Пропускаем одиночные точки с запятой
-        if self._match("SEPARATOR", ";"):
-            self._advance()
+        i = self.pos
+        if i >= self.n:
             return None
         
-        # Блок
-        if self._match("SEPARATOR", "{"):
-            return self._parse_block()
-        
-        # this() — вызов другого конструктора
-        if self._match("KEYWORD", "this"):
-            next_tok = self._peek_token()
-            if next_tok and next_tok.lexeme == "(":
-                return self._parse_this_call()
-        
-        # super() — вызов конструктора родителя  
-        if self._match("KEYWORD", "super"):
-            next_tok = self._peek_token()
-            if next_tok and next_tok.lexeme == "(":
-                return self._parse_super_call()
-        
-        # return
-        if self._match("KEYWORD", "return"):
-            return self._parse_return_statement()
+        t = self.types[i]
         
-        # throw
-        if self._match("KEYWORD", "throw"):
-            return self._parse_throw_statement()
-        
-        # if
-        if self._match("KEYWORD", "if"):
-            return self._parse_if_statement()
-        
-        # try-catch-finally
-        if self._match("KEYWORD", "try"):
-            return self._parse_try_statement()
-        
-        # while
-        if self._match("KEYWORD", "while"):
-            return self._parse_while_statement()
-        
-        # do-while
-        if self._match("KEYWORD", "do"):
-            return self._parse_do_while_statement()
-        
-        # for
-        if self._match("KEYWORD", "for"):
-            return self._parse_for_statement()
-        
-        # switch
-        if self._match("KEYWORD", "switch"):
-            return self._parse_switch_statement()
-        
-        # break
-        if self._match("KEYWORD", "break"):
-            return self._parse_break_statement()
-        
-        # continue
-        if self._match("KEYWORD", "continue"):
-            return self._parse_continue_statement()
+        if t is _SEP:
+            lex = self.lexemes[i]
+            # Пропускаем одиночные точки с запятой
+            if lex == ";":
+                self._advance()
+                return None
+            # Блок
+            if lex == "{":
+                return self._parse_block()
+        
+        elif t is _KW:
+            lex = self.lexemes[i]
+            # this()/super() — вызов конструктора; без '(' это выражение
+            if lex == "this":
+                if self.lexemes[i + 1] == "(":
+                    return self._parse_this_call()
+            elif lex == "super":
+                if self.lexemes[i + 1] == "(":
+                    return self._parse_super_call()
+            else:
+                # Один поиск в таблице вместо цепочки из десяти _match
+                handler = self._STMT_DISPATCH.get(lex)
+                if handler is not None:
+                    return handler(self)
         
         # Объявление переменной или выражение
         if self._is_variable_declaration():
@@ -614,26 +759,28 @@ class Parser:
                     | 'default' ':' statement*
         """
         pos = self._current_position()
-        self._expect("KEYWORD", "switch")
-        self._expect("SEPARATOR", "(")
+        self._expect(_KW, "switch")
+        self._expect(_SEP, "(")
         
         # Выражение switch
         expression = self._parse_expression()
         
-        self._expect("SEPARATOR", ")")
-        self._expect("SEPARATOR", "{")
+        self._expect(_SEP, ")")
+        self._expect(_SEP, "{")
         
         # Парсим case'ы
         cases = []
-        while not self._match("SEPARATOR", "}"):
-            if not self.current_token:
+        types = self.types
+        lexemes = self.lexemes
+        while not (types[self.pos] is _SEP and lexemes[self.pos] == "}"):
+            if self.pos >= self.n:
                 raise ParseError("Незакрытый switch", pos.line, pos.column)
             
             case = self._parse_switch_case()
             if case:
                 cases.append(case)
         
-        self._expect("SEPARATOR", "}")
+        self._expect(_SEP, "}")
         
         return SwitchStatement(
             node_type=NodeType.SWITCH_STATEMENT,
@@ -648,9 +795,9 @@ class Parser:
         pos = self._current_position()
         
         # default:
-        if self._match("KEYWORD", "default"):
+        if self._match(_KW, "default"):
             self._advance()
-            self._expect("OPERATOR", ":")
+            self._expect(_OP, ":")
             
             statements = self._parse_case_statements()
             
@@ -663,12 +810,12 @@ class Parser:
             )
         
         # case expr:
-        if self._match("KEYWORD", "case"):
+        if self._match(_KW, "case"):
             self._advance()
             
             label = self._parse_expression()
             
-            self._expect("OPERATOR", ":")
+            self._expect(_OP, ":")
             
             statements = self._parse_case_statements()
             
@@ -688,13 +835,16 @@ class Parser:
         """Парсинг statements внутри case до следующего case/default/}."""
         statements = []
         
-        while self.current_token:
+        types = self.types
+        lexemes = self.lexemes
+        n = self.n
+        while self.pos < n:
             # Останавливаемся на case, default или }
-            if self._match("KEYWORD", "case"):
-                break
-            if self._match("KEYWORD", "default"):
+            t = types[self.pos]
+            lex = lexemes[self.pos]
+            if t is _KW and (lex == "case" or lex == "default"):
                 break
-            if self._match("SEPARATOR", "}"):
+            if t is _SEP and lex == "}":
                 break
             
             stmt = self._parse_statement()
@@ -702,34 +852,40 @@ class Parser:
                 statements.append(stmt)
         
         return statements
-    def _is_variable_declaration(self) -> bool:
-        """Проверка, является ли текущая позиция объявлением переменной."""
-        start_pos = self._save_position()
+    def _scan_type(self, i: int) -> int:
+        """Просмотр типа по индексу без разбора и аллокаций.
         
-        print(f"[DEBUG] _is_variable_declaration: token={self.current_token}")
+        Возвращает индекс первого токена после типа или -1, если с
+        позиции i тип не начинается. Форма типа: (KEYWORD | IDENTIFIER)
+        с опциональной парой '[' ']'.
+        """
+        types = self.types
+        t = types[i]
+        if t is not _KW and t is not _IDENT:
+            return -1
+        j = i + 1
+        if j < self.n and types[j] is _SEP and self.lexemes[j] == "[":
+            if self.lexemes[j + 1] != "]":
+                return -1
+            j += 2
+        return j
+
+    def _is_variable_declaration(self) -> bool:
+        """Проверка, является ли текущая позиция объявлением переменной.
         
-        try:
-            # Пробуем распарсить тип
-            parsed_type = self._parse_type()
-            print(f"[DEBUG] Parsed type: {parsed_type.name}, is_array={parsed_type.is_array}")
-            print(f"[DEBUG] After type, token={self.current_token}")
-            
-            # После типа должен быть идентификатор
-            if self.current_token and self.current_token.type == "IDENTIFIER":
-                next_pos = self.pos + 1
-                if next_pos < len(self.tokens):
-                    next_lexeme = self.tokens[next_pos].lexeme
-                    print(f"[DEBUG] Identifier={self.current_token.lexeme}, next={next_lexeme}")
-                    result = next_lexeme in ["=", ";", ","]
-                    print(f"[DEBUG] Is var declaration: {result}")
-                    return result
-            print(f"[DEBUG] Not a var declaration (no identifier after type)")
+        Чистый просмотр: тип, затем идентификатор, затем '=', ';' или
+        ','. Позиция парсера не двигается, откатывать нечего.
+        """
+        i = self.pos
+        if i >= self.n:
             return False
-        except Exception as e:
-            print(f"[DEBUG] Exception in _is_variable_declaration: {e}")
+        
+        j = self._scan_type(i)
+        if j < 0 or self.types[j] is not _IDENT:
             return False
-        finally:
-            self._restore_position(start_pos)
+        
+        # Сентинел даёт пустую лексему за последним токеном
+        return self.lexemes[j + 1] in ("=", ";", ",")
 
     def _parse_this_call(self) -> ThisCall:
         """Парсинг this(args) — вызов другого конструктора.
@@ -737,13 +893,13 @@ class Parser:
         Пример: this("default", 0);
         """
         pos = self._current_position()
-        self._expect("KEYWORD", "this")
-        self._expect("SEPARATOR", "(")
+        self._expect(_KW, "this")
+        self._expect(_SEP, "(")
         
         arguments = self._parse_arguments()
         
-        self._expect("SEPARATOR", ")")
-        self._expect("SEPARATOR", ";")
+        self._expect(_SEP, ")")
+        self._expect(_SEP, ";")
         
         return ThisCall(
             node_type=NodeType.THIS_CALL,
@@ -758,13 +914,13 @@ class Parser:
         Пример: super(x, y);
         """
         pos = self._current_position()
-        self._expect("KEYWORD", "super")
-        self._expect("SEPARATOR", "(")
+        self._expect(_KW, "super")
+        self._expect(_SEP, "(")
         
         arguments = self._parse_arguments()
         
-        self._expect("SEPARATOR", ")")
-        self._expect("SEPARATOR", ";")
+        self._expect(_SEP, ")")
+        self._expect(_SEP, ";")
         
         return SuperCall(
             node_type=NodeType.SUPER_CALL,
@@ -775,14 +931,8 @@ class Parser:
         """Парсинг объявления локальной переменной."""
         pos = self._current_position()
         
-        print(f"[DEBUG] _parse_variable_declaration START: token={self.current_token}")
-        
         var_type = self._parse_type()
-        print(f"[DEBUG] Parsed var_type: {var_type.name}, is_array={var_type.is_array}")
-        print(f"[DEBUG] After type, token={self.current_token}")
-        
-        var_name = self._expect("IDENTIFIER").lexeme
-        print(f"[DEBUG] var_name={var_name}, token={self.current_token}")
+        var_name = self._expect(_IDENT)
         
         var_decl = VariableDeclaration(
             NodeType.VARIABLE_DECLARATION,
@@ -791,15 +941,12 @@ class Parser:
         )
         var_decl.var_type = var_type
         
-        if self._match("OPERATOR", "="):
+        if self._match(_OP, "="):
             self._advance()
-            print(f"[DEBUG] Parsing initializer, token={self.current_token}")
             var_decl.value = self._parse_expression()
-            print(f"[DEBUG] After initializer, token={self.current_token}")
         
-        print(f"[DEBUG] Expecting semicolon, token={self.current_token}")
-        self._expect("SEPARATOR", ";")
-        print(f"[DEBUG] Variable declaration complete: {var_name}")
+        self._expect(_SEP, ";")
+        self._log(f"Объявление переменной: {var_name}")
         
         return var_decl
 
@@ -822,19 +969,17 @@ class Parser:
             return None
         
         # Ожидаем точку с запятой
-        if self._match("SEPARATOR", ";"):
+        if self._match(_SEP, ";"):
             self._advance()
         else:
             # Если нет точки с запятой — ошибка
             raise ParseError(
                 f"Ожидалась ';' после выражения",
-                self.current_token.line if self.current_token else pos.line,
-                self.current_token.column if self.current_token else pos.column
+                self.lines[self.pos] if self.pos < self.n else pos.line,
+                self.columns[self.pos] if self.pos < self.n else pos.column
             )
         
-        stmt = ASTNode(NodeType.EXPRESSION_STATEMENT, pos)
-        stmt.add_child(expr)
-        return stmt
+        return ASTNode(NodeType.EXPRESSION_STATEMENT, pos, children=[expr])
 
 
     def _parse_return_statement(self):
@@ -843,17 +988,16 @@ class Parser:
         Grammar: returnStmt → 'return' expr? ';'
         """
         pos = self._current_position()
-        self._expect("KEYWORD", "return")
+        self._expect(_KW, "return")
         
-        return_node = ASTNode(NodeType.RETURN_STATEMENT, pos)
-        
-        if not self._match("SEPARATOR", ";"):
+        children = []
+        if not self._match(_SEP, ";"):
             expr = self._parse_expression()
             if expr:
-                return_node.add_child(expr)
+                children.append(expr)
         
-        self._expect("SEPARATOR", ";")
-        return return_node
+        self._expect(_SEP, ";")
+        return ASTNode(NodeType.RETURN_STATEMENT, pos, children=children)
 
     def _parse_if_statement(self):
         """Парсинг if-else.
@@ -861,25 +1005,22 @@ class Parser:
         Grammar: ifStmt → 'if' '(' expr ')' statement ('else' statement)?
         """
         pos = self._current_position()
-        self._expect("KEYWORD", "if")
-        self._expect("SEPARATOR", "(")
+        self._expect(_KW, "if")
+        self._expect(_SEP, "(")
         
         condition = self._parse_expression()
         
-        self._expect("SEPARATOR", ")")
+        self._expect(_SEP, ")")
         
         then_branch = self._parse_statement()
         
-        if_node = ASTNode(NodeType.IF_STATEMENT, pos)
-        if_node.add_child(condition)
-        if_node.add_child(then_branch)
+        children = [condition, then_branch]
         
-        if self._match("KEYWORD", "else"):
+        if self._match(_KW, "else"):
             self._advance()
-            else_branch = self._parse_statement()
-            if_node.add_child(else_branch)
+            children.append(self._parse_statement())
         
-        return if_node
+        return ASTNode(NodeType.IF_STATEMENT, pos, children=children)
 
     def _parse_while_statement(self):
         """Парсинг while.
@@ -887,20 +1028,16 @@ class Parser:
         Grammar: whileStmt → 'while' '(' expr ')' statement
         """
         pos = self._current_position()
-        self._expect("KEYWORD", "while")
-        self._expect("SEPARATOR", "(")
+        self._expect(_KW, "while")
+        self._expect(_SEP, "(")
         
         condition = self._parse_expression()
         
-        self._expect("SEPARATOR", ")")
+        self._expect(_SEP, ")")
         
         body = self._parse_statement()
         
-        while_node = ASTNode(NodeType.WHILE_STATEMENT, pos)
-        while_node.add_child(condition)
-        while_node.add_child(body)
-        
-        return while_node
+        return ASTNode(NodeType.WHILE_STATEMENT, pos, children=[condition, body])
 
     def _parse_for_statement(self):
         """Парсинг for или for-each.
@@ -911,8 +1048,8 @@ class Parser:
                     | type IDENTIFIER ':' expr         (for-each)
         """
         pos = self._current_position()
-        self._expect("KEYWORD", "for")
-        self._expect("SEPARATOR", "(")
+        self._expect(_KW, "for")
+        self._expect(_SEP, "(")
     
         # Пробуем определить: это for-each или обычный for?
         if self._is_for_each():
@@ -925,25 +1062,18 @@ class Parser:
         for-each: for (Type var : iterable)
         regular:  for (init; condition; update)
         
-        Отличие: в for-each после "Type var" идёт ":", а не "=" или ";"
+        Отличие: в for-each после "Type var" идёт ":", а не "=" или ";".
+        Чистый просмотр по массивам, без разбора с откатом.
         """
-        saved_pos = self._save_position()
+        i = self.pos
+        if i >= self.n:
+            return False
         
-        try:
-            # Пробуем прочитать тип
-            self._parse_type()
-            
-            # Должен быть идентификатор
-            if not self._match("IDENTIFIER"):
-                return False
-            self._advance()
-            
-            # Если после идентификатора ":" — это for-each
-            return self._match("OPERATOR", ":")
-        except:
+        j = self._scan_type(i)
+        if j < 0 or self.types[j] is not _IDENT:
             return False
-        finally:
-            self._restore_position(saved_pos)
+        
+        return self.types[j + 1] is _OP and self.lexemes[j + 1] == ":"
 
     def _parse_for_each_body(self, pos: Position) -> ForEachStatement:
         """Парсинг тела for-each после 'for ('.
@@ -954,16 +1084,16 @@ class Parser:
         var_type = self._parse_type()
         
         # Имя переменной
-        var_name = self._expect("IDENTIFIER").lexeme
+        var_name = self._expect(_IDENT)
         
         # Двоеточие
-        self._expect("OPERATOR", ":")
+        self._expect(_OP, ":")
         
         # Итерируемое выражение
         iterable = self._parse_expression()
         
         # Закрывающая скобка
-        self._expect("SEPARATOR", ")")
+        self._expect(_SEP, ")")
         
         # Тело цикла
         body = self._parse_statement()
@@ -982,50 +1112,45 @@ class Parser:
         
         Grammar: forInit? ';' expr? ';' expr? ')' statement
         """
-        for_node = ASTNode(NodeType.FOR_STATEMENT, pos)
-        
         # init
-        if not self._match("SEPARATOR", ";"):
+        if not self._match(_SEP, ";"):
             if self._is_variable_declaration():
                 init = self._parse_for_var_declaration()
             else:
                 init = self._parse_expression()
-            for_node.add_child(init)
         else:
-            for_node.add_child(ASTNode(NodeType.IDENTIFIER, pos, name=""))
+            init = ASTNode(NodeType.IDENTIFIER, pos, name="")
         
-        self._expect("SEPARATOR", ";")
+        self._expect(_SEP, ";")
         
         # condition
-        if not self._match("SEPARATOR", ";"):
+        if not self._match(_SEP, ";"):
             condition = self._parse_expression()
-            for_node.add_child(condition)
         else:
-            for_node.add_child(ASTNode(NodeType.IDENTIFIER, pos, name=""))
+            condition = ASTNode(NodeType.IDENTIFIER, pos, name="")
         
-        self._expect("SEPARATOR", ";")
+        self._expect(_SEP, ";")
         
         # update
-        if not self._match("SEPARATOR", ")"):
+        if not self._match(_SEP, ")"):
             update = self._parse_expression()
-            for_node.add_child(update)
         else:
-            for_node.add_child(ASTNode(NodeType.IDENTIFIER, pos, name=""))
+            update = ASTNode(NodeType.IDENTIFIER, pos, name="")
         
-        self._expect("SEPARATOR", ")")
+        self._expect(_SEP, ")")
         
         # body
         body = self._parse_statement()
-        for_node.add_child(body)
         
-        return for_node
+        return ASTNode(NodeType.FOR_STATEMENT, pos,
+                       children=[init, condition, update, body])
 
     def _parse_for_var_declaration(self) -> VariableDeclaration:
         """Парсинг объявления переменной в for (без точки с запятой)."""
         pos = self._current_position()
         
         var_type = self._parse_type()
-        var_name = self._expect("IDENTIFIER").lexeme
+        var_name = self._expect(_IDENT)
         
         var_decl = VariableDeclaration(
             NodeType.VARIABLE_DECLARATION,
@@ -1034,7 +1159,7 @@ class Parser:
         )
         var_decl.var_type = var_type
         
-        if self._match("OPERATOR", "="):
+        if self._match(_OP, "="):
             self._advance()
             var_decl.value = self._parse_expression()
         
@@ -1061,13 +1186,8 @@ class Parser:
         if left is None:
             return None
         
-        assignment_ops = ["=", "+=", "-=", "*=", "/="]
-        
-        if (self.current_token and 
-            self.current_token.type == "OPERATOR" and
-            self.current_token.lexeme in assignment_ops):
-            
-            operator = self.current_token.lexeme
+        if self.is_assign[self.pos]:
+            operator = self.lexemes[self.pos]
             self._advance()
             right = self._parse_assignment()
             
@@ -1092,20 +1212,25 @@ class Parser:
         ниже чем логические операции, но выше чем присваивание.
         """
         pos = self._current_position()
-        condition = self._parse_logic_or()
+        condition = self._parse_binary()
         
         if condition is None:
             return None
         
-        # Проверяем наличие ?
-        if self._match("OPERATOR", "?"):
+        # Проверяем наличие ? (прямое сравнение: точка на пути каждого выражения)
+        i = self.pos
+        if self.types[i] is _OP and self.lexemes[i] == "?":
             self._advance()
             
             # Выражение для true-ветки
             then_expr = self._parse_expression()
             
-            # Ожидаем :
-            self._expect("OPERATOR", ":")
+            # Ожидаем : (инлайн быстрого пути)
+            i = self.pos
+            if self.types[i] is _OP and self.lexemes[i] == ":":
+                self.pos = i + 1
+            else:
+                self._expect(_OP, ":")
             
             # Выражение для false-ветки (рекурсивно для правой ассоциативности)
             else_expr = self._parse_ternary()
@@ -1120,77 +1245,41 @@ class Parser:
         
         return condition
 
-    def _parse_logic_or(self):
-        """Парсинг логического ИЛИ.
-        
-        Grammar: logicOr → logicAnd ('||' logicAnd)*
-        """
-        left = self._parse_logic_and()
-        
-        while (self.current_token and
-               self.current_token.type == "OPERATOR" and
-               self.current_token.lexeme == "||"):
-            
-            operator = self.current_token.lexeme
-            pos = self._current_position()
-            self._advance()
-            right = self._parse_logic_and()
-            
-            if right:
-                left = BinaryOperation(
-                    NodeType.BINARY_OPERATION,
-                    pos,
-                    operator=operator,
-                    left=left,
-                    right=right
-                )
+    def _parse_binary(self, min_prec: int = 1):
+        """Разбор бинарных операций методом precedence climbing.
         
-        return left
-
-    def _parse_logic_and(self):
-        """Парсинг логического И.
+        Grammar: binary → unary (binOp binary)*
         
-        Grammar: logicAnd → equality ('&&' equality)*
+        Один цикл с таблицей приоритетов _BINOP_PREC вместо каскада из
+        шести методов (|| && == < + *): на каждое первичное выражение
+        приходится один кадр вместо шести. Левая ассоциативность —
+        рекурсия справа идёт с приоритетом prec + 1.
         """
-        left = self._parse_equality()
+        left = self._parse_unary()
         
-        while (self.current_token and
-               self.current_token.type == "OPERATOR" and
-               self.current_token.lexeme == "&&"):
-            
-            operator = self.current_token.lexeme
-            pos = self._current_position()
-            self._advance()
-            right = self._parse_equality()
-            
-            if right:
-                left = BinaryOperation(
-                    NodeType.BINARY_OPERATION,
-                    pos,
-                    operator=operator,
-                    left=left,
-                    right=right
-                )
+        if left is None:
+            return None
         
-        return left
-
-    def _parse_equality(self):
-        """Парсинг равенства/неравенства.
+        types = self.types
+        lexemes = self.lexemes
+        prec_of = _BINOP_PREC
         
-        Grammar: equality → comparison (('==' | '!=') comparison)*
-        """
-        left = self._parse_comparison()
-        
-        while (self.current_token and
-               self.current_token.type == "OPERATOR" and
-               self.current_token.lexeme in ["==", "!="]):
-            
-            operator = self.current_token.lexeme
-            pos = self._current_position()
-            self._advance()
-            right = self._parse_comparison()
+        while True:
+            i = self.pos
+            t = types[i]
             
-            if right:
+            if t is _OP:
+                operator = lexemes[i]
+                prec = prec_of.get(operator)
+                if prec is None or prec < min_prec:
+                    break
+                
+                pos = self._current_position()
+                self._advance()
+                right = self._parse_binary(prec + 1)
+                
+                if right is None:
+                    break
                 left = BinaryOperation(
                     NodeType.BINARY_OPERATION,
                     pos,
@@ -1198,37 +1287,9 @@ class Parser:
                     left=left,
                     right=right
                 )
-        
-        return left
-
-    def _parse_comparison(self):
-        """Парсинг сравнения.
-        
-        Grammar: comparison → addition (('<' | '>' | '<=' | '>=' | 'instanceof') addition)*
-        """
-        left = self._parse_addition()
-        
-        while self.current_token:
-            # Обычные операторы сравнения
-            if (self.current_token.type == "OPERATOR" and
-                self.current_token.lexeme in ["<", ">", "<=", ">="]):
-                
-                operator = self.current_token.lexeme
-                pos = self._current_position()
-                self._advance()
-                right = self._parse_addition()
-                
-                if right:
-                    left = BinaryOperation(
-                        NodeType.BINARY_OPERATION,
-                        pos,
-                        operator=operator,
-                        left=left,
-                        right=right
-                    )
             
             # instanceof (NEW!)
-            elif self._match("KEYWORD", "instanceof"):
+            elif t is _KW and lexemes[i] == "instanceof" and _INSTANCEOF_PREC >= min_prec:
                 pos = self._current_position()
                 self._advance()
                 
@@ -1247,60 +1308,6 @@ class Parser:
         
         return left
 
-    def _parse_addition(self):
-        """Парсинг сложения/вычитания.
-        
-        Grammar: addition → multiplication (('+' | '-') multiplication)*
-        """
-        left = self._parse_multiplication()
-        
-        while (self.current_token and
-               self.current_token.type == "OPERATOR" and
-               self.current_token.lexeme in ["+", "-"]):
-            
-            operator = self.current_token.lexeme
-            pos = self._current_position()
-            self._advance()
-            right = self._parse_multiplication()
-            
-            if right:
-                left = BinaryOperation(
-                    NodeType.BINARY_OPERATION,
-                    pos,
-                    operator=operator,
-                    left=left,
-                    right=right
-                )
-        
-        return left
-
-    def _parse_multiplication(self):
-        """Парсинг умножения/деления.
-        
-        Grammar: multiplication → unary (('*' | '/' | '%') unary)*
-        """
-        left = self._parse_unary()
-        
-        while (self.current_token and
-               self.current_token.type == "OPERATOR" and
-               self.current_token.lexeme in ["*", "/", "%"]):
-            
-            operator = self.current_token.lexeme
-            pos = self._current_position()
-            self._advance()
-            right = self._parse_unary()
-            
-            if right:
-                left = BinaryOperation(
-                    NodeType.BINARY_OPERATION,
-                    pos,
-                    operator=operator,
-                    left=left,
-                    right=right
-                )
-        
-        return left
-
     def _parse_unary(self):
         """Парсинг унарных операций.
         
@@ -1308,11 +1315,9 @@ class Parser:
         """
         pos = self._current_position()
         
-        if (self.current_token and
-            self.current_token.type == "OPERATOR" and
-            self.current_token.lexeme in ["!", "-", "++", "--"]):
-            
-            operator = self.current_token.lexeme
+        i = self.pos
+        if self.types[i] is _OP and self.lexemes[i] in _UNARY_OPS:
+            operator = self.lexemes[i]
             self._advance()
             operand = self._parse_unary()
             
@@ -1339,11 +1344,9 @@ class Parser:
         if expr is None:
             return None
         
-        if (self.current_token and
-            self.current_token.type == "OPERATOR" and
-            self.current_token.lexeme in ["++", "--"]):
-            
-            operator = self.current_token.lexeme
+        i = self.pos
+        if self.types[i] is _OP and self.lexemes[i] in _INCDEC_OPS:
+            operator = self.lexemes[i]
             self._advance()
             
             return UnaryOperation(
@@ -1365,33 +1368,73 @@ class Parser:
             arr[0]
             arr[i].field
         """
-        while self.current_token:
+        types = self.types
+        lexemes = self.lexemes
+        n = self.n
+        
+        while self.pos < n:
+            # Цепочка продолжается только разделителем — инлайн-проверка
+            # вместо трёх вызовов _match на каждое звено
+            if types[self.pos] is not _SEP:
+                break
+            lex = lexemes[self.pos]
+            
             # Вызов метода: node(...)
-            if self._match("SEPARATOR", "("):
+            if lex == "(":
                 node = self._parse_method_call_args(node, pos)
             
             # Доступ к полю: node.field
-            elif self._match("SEPARATOR", "."):
+            elif lex == ".":
                 self._advance()
                 
-                if not self._match("IDENTIFIER"):
+                if types[self.pos] is not _IDENT:
                     break
                 
-                field_name = self.current_token.lexeme
-                field_pos = self._current_position()
+                i = self.pos
+                field_name = lexemes[i]
                 self._advance()
-                
+
+                # obj.method(...): строим MethodCall сразу — промежуточная
+                # пара FieldAccess/Identifier была бы тут же разобрана и
+                # выброшена в _parse_method_call_args
+                if types[self.pos] is _SEP and lexemes[self.pos] == "(":
+                    self._advance()
+                    arguments = self._parse_arguments()
+                    # Закрывающая ')' — инлайн быстрого пути; ошибку,
+                    # как и раньше, поднимает _expect
+                    i = self.pos
+                    if types[i] is _SEP and lexemes[i] == ")":
+                        self.pos = i + 1
+                    else:
+                        self._expect(_SEP, ")")
+                    node = MethodCall(
+                        NodeType.METHOD_CALL,
+                        pos,
+                        method_name=field_name,
+                        arguments=arguments,
+                        children=[node]
+                    )
+                    continue
+
+                # Позиция имени снимается прямо из массивов: pos < n
+                # гарантирован, обёртка _current_position здесь лишняя
+                field_pos = Position.get(self.lines[i], self.columns[i])
+
                 # Создаём узел доступа к полю
-                field_access = ASTNode(NodeType.FIELD_ACCESS, pos)
-                field_access.add_child(node)
-                field_access.add_child(Identifier(NodeType.IDENTIFIER, field_pos, name=field_name))
-                node = field_access
+                node = ASTNode(
+                    NodeType.FIELD_ACCESS, pos,
+                    children=[node, Identifier(NodeType.IDENTIFIER, field_pos, name=field_name)]
+                )
             
             # Доступ к элементу массива: node[index]
-            elif self._match("SEPARATOR", "["):
+            elif lex == "[":
                 self._advance()
                 index = self._parse_expression()
-                self._expect("SEPARATOR", "]")
+                i = self.pos
+                if types[i] is _SEP and lexemes[i] == "]":
+                    self.pos = i + 1
+                else:
+                    self._expect(_SEP, "]")
                 
                 node = ArrayAccess(
                     node_type=NodeType.ARRAY_ACCESS,
@@ -1408,60 +1451,77 @@ class Parser:
 
 
     def _parse_primary(self):
-        """Парсинг первичных выражений."""
-        pos = self._current_position()
+        """Парсинг первичных выражений.
         
-        if not self.current_token:
+        Обработчик выбирается по типу токена одним dict.get вместо
+        каскада _match-проверок на this/super/new/литералы/скобки.
+        """
+        if self.pos >= self.n:
             return None
         
-        # this
-        if self._match("KEYWORD", "this"):
-            self._advance()
-            node = Identifier(NodeType.IDENTIFIER, pos, name="this")
-            return self._parse_access_chain(node, pos)
+        handler = self._PRIMARY_DISPATCH.get(self.types[self.pos])
+        if handler is not None:
+            return handler(self)
+        return None
+
+    def _parse_primary_keyword(self):
+        """Первичное выражение, начинающееся с ключевого слова."""
+        pos = self._current_position()
+        lex = self.lexemes[self.pos]
         
-        # super
-        if self._match("KEYWORD", "super"):
+        # this / super
+        if lex == "this" or lex == "super":
             self._advance()
-            node = Identifier(NodeType.IDENTIFIER, pos, name="super")
+            node = Identifier(NodeType.IDENTIFIER, pos, name=lex)
             return self._parse_access_chain(node, pos)
         
         # new - НЕ ПРОДВИГАЕМСЯ, пусть _parse_new_expression сам съест new
-        if self._match("KEYWORD", "new"):
+        if lex == "new":
             return self._parse_new_expression()
         
-        # Литералы
-        if self.current_token.type in ["INT_LITERAL", "FLOAT_LITERAL", 
-                                        "STRING_LITERAL", "CHAR_LITERAL",
-                                        "BOOLEAN_LITERAL", "NULL_LITERAL"]:
-            token = self.current_token
-            self._advance()
-            literal_type = token.type.lower().replace("_literal", "")
-            return Literal(NodeType.LITERAL, pos, value=token.lexeme, literal_type=literal_type)
-        
         # true/false/null как ключевые слова
-        if self._match("KEYWORD", "true") or self._match("KEYWORD", "false"):
-            value = self.current_token.lexeme
+        if lex == "true" or lex == "false":
             self._advance()
-            return Literal(NodeType.LITERAL, pos, value=value, literal_type="boolean")
+            return Literal(NodeType.LITERAL, pos, value=lex, literal_type="boolean")
         
-        if self._match("KEYWORD", "null"):
+        if lex == "null":
             self._advance()
             return Literal(NodeType.LITERAL, pos, value="null", literal_type="null")
         
-        # Идентификатор
-        if self._match("IDENTIFIER"):
-            name = self.current_token.lexeme
-            self._advance()
-            node = Identifier(NodeType.IDENTIFIER, pos, name=name)
-            return self._parse_access_chain(node, pos)
-        
-        # Скобки
-        if self._match("SEPARATOR", "("):
+        return None
+
+    def _parse_primary_literal(self):
+        """Литерал: literal_type берётся из готовой таблицы."""
+        pos = self._current_position()
+        literal_type = _LITERAL_KIND[self.types[self.pos]]
+        value = self.lexemes[self.pos]
+        self._advance()
+        return Literal(NodeType.LITERAL, pos, value=value, literal_type=literal_type)
+
+    def _parse_primary_identifier(self):
+        """Идентификатор и его цепочка доступа."""
+        pos = self._current_position()
+        name = self.lexemes[self.pos]
+        self._advance()
+        node = Identifier(NodeType.IDENTIFIER, pos, name=name)
+        return self._parse_access_chain(node, pos)
+
+    def _parse_primary_separator(self):
+        """Скобочное выражение или cast."""
+        if self.lexemes[self.pos] == "(":
             return self._parse_parenthesized_or_cast()
-        
         return None
 
+    # Таблица первичных выражений: тип токена -> метод
+    _PRIMARY_DISPATCH = {
+        _KW: _parse_primary_keyword,
+        _IDENT: _parse_primary_identifier,
+        _SEP: _parse_primary_separator,
+    }
+    for _lt in _LITERAL_KIND:
+        _PRIMARY_DISPATCH[_lt] = _parse_primary_literal
+    del _lt
+
     def _parse_parenthesized_or_cast(self):
         """Парсинг скобочного выражения или cast.
         
@@ -1473,7 +1533,7 @@ class Parser:
         а после него ')' — это cast.
         """
         pos = self._current_position()
-        self._expect("SEPARATOR", "(")
+        self._expect(_SEP, "(")
         
         # Пробуем определить: это cast или группировка?
         if self._is_cast():
@@ -1481,7 +1541,7 @@ class Parser:
         else:
             # Обычная группировка
             expr = self._parse_expression()
-            self._expect("SEPARATOR", ")")
+            self._expect(_SEP, ")")
             return expr
 
 
@@ -1493,60 +1553,54 @@ class Parser:
         
         Эвристика: после '(' идёт тип, затем ')'.
         Типы: примитивы (int, long...) или идентификаторы (String, MyClass).
+        
+        Чистый просмотр по массивам: позиция парсера не двигается,
+        откатывать и ловить исключения не нужно.
         """
-        saved_pos = self._save_position()
+        types = self.types
+        lexemes = self.lexemes
+        n = self.n
+        i = self.pos
         
-        try:
-            # После '(' должен быть тип
-            if not self.current_token:
-                return False
-            
-            # Примитивные типы — точно cast
-            primitives = {"int", "long", "double", "float", "boolean", 
-                        "char", "byte", "short"}
-            
-            if (self.current_token.type == "KEYWORD" and 
-                self.current_token.lexeme in primitives):
-                self._advance()
-                # Проверяем [] для массивов
-                if self._match("SEPARATOR", "["):
-                    self._advance()
-                    if not self._match("SEPARATOR", "]"):
-                        return False
-                    self._advance()
-                return self._match("SEPARATOR", ")")
-            
-            # Идентификатор — может быть cast или переменная
-            if self.current_token.type == "IDENTIFIER":
-                self._advance()
-                # Проверяем [] для массивов
-                if self._match("SEPARATOR", "["):
-                    self._advance()
-                    if not self._match("SEPARATOR", "]"):
-                        return False
-                    self._advance()
-                # Если после идентификатора ')' — это cast
-                # Но нужно убедиться, что после ')' идёт выражение, не оператор
-                if self._match("SEPARATOR", ")"):
-                    # Смотрим что после ')'
-                    next_tok = self._peek_token()
-                    if next_tok:
-                        # Если после ')' идёт идентификатор, литерал, '(' или унарный оператор — cast
-                        if next_tok.type in ["IDENTIFIER", "INT_LITERAL", "FLOAT_LITERAL", 
-                                            "STRING_LITERAL", "CHAR_LITERAL"]:
-                            return True
-                        if next_tok.lexeme in ["(", "!", "-", "++", "--", "new", "this", "super"]:
-                            return True
-                        if next_tok.type == "KEYWORD" and next_tok.lexeme in ["new", "this", "super", "true", "false", "null"]:
-                            return True
-                    return False
-            
+        if i >= n:
             return False
-        except:
-            return False
-        finally:
-            self._restore_position(saved_pos)
-
+        
+        t = types[i]
+        
+        # Примитивные типы — точно cast
+        if t is _KW and lexemes[i] in _PRIMITIVE_TYPES:
+            j = i + 1
+            # Проверяем [] для массивов
+            if j < n and types[j] is _SEP and lexemes[j] == "[":
+                if j + 1 >= n or lexemes[j + 1] != "]":
+                    return False
+                j += 2
+            return j < n and types[j] is _SEP and lexemes[j] == ")"
+        
+        # Идентификатор — может быть cast или переменная
+        if t is _IDENT:
+            j = i + 1
+            # Проверяем [] для массивов
+            if j < n and types[j] is _SEP and lexemes[j] == "[":
+                if j + 1 >= n or lexemes[j + 1] != "]":
+                    return False
+                j += 2
+            # Если после идентификатора ')' — это cast
+            # Но нужно убедиться, что после ')' идёт выражение, не оператор
+            if j < n and types[j] is _SEP and lexemes[j] == ")":
+                k = j + 1
+                if k < n:
+                    # Если после ')' идёт идентификатор, литерал, '(' или
+                    # унарный оператор — cast
+                    if types[k] in _CAST_FOLLOW_TYPES:
+                        return True
+                    if lexemes[k] in _CAST_FOLLOW_LEX:
+                        return True
+                    if types[k] is _KW and lexemes[k] in _CAST_FOLLOW_KW:
+                        return True
+                return False
+        
+        return False
 
     def _parse_cast(self, pos: Position) -> CastExpression:
         """Парсинг cast выражения.
@@ -1559,7 +1613,7 @@ class Parser:
         target_type = self._parse_type()
         
         # Закрывающая скобка
-        self._expect("SEPARATOR", ")")
+        self._expect(_SEP, ")")
         
         # Выражение (с высоким приоритетом — unary)
         expression = self._parse_unary()
@@ -1585,12 +1639,12 @@ class Parser:
             modifiers=modifiers
         )
         
-        self._expect("SEPARATOR", "(")
+        self._expect(_SEP, "(")
         method.parameters = self._parse_parameters()
-        self._expect("SEPARATOR", ")")
+        self._expect(_SEP, ")")
         
         # throws clause (NEW!)
-        if self._match("KEYWORD", "throws"):
+        if self._match(_KW, "throws"):
             self._advance()
             method.throws = self._parse_throws_clause()
         
@@ -1612,7 +1666,7 @@ class Parser:
         exceptions.append(exc_type)
         
         # Остальные через запятую
-        while self._match("SEPARATOR", ","):
+        while self._match(_SEP, ","):
             self._advance()
             exc_type = self._parse_type()
             exceptions.append(exc_type)
@@ -1638,32 +1692,23 @@ class Parser:
         else:
             method_name = "unknown"
         
-        method_call = MethodCall(
-            NodeType.METHOD_CALL,
-            pos,
-            method_name=method_name
-        )
-        
-        # Если target - это field_access, добавляем объект как child
+        # Если target - это field_access, объект идёт как child
         if isinstance(target, ASTNode) and target.node_type == NodeType.FIELD_ACCESS:
-            method_call.add_child(target.children[0] if target.children else target)
-        
-        self._expect("SEPARATOR", "(")
-        
-        # Аргументы
-        if not self._match("SEPARATOR", ")"):
-            while True:
-                arg = self._parse_expression()
-                if arg:
-                    method_call.arguments.append(arg)
-                
-                if not self._match("SEPARATOR", ","):
-                    break
-                self._advance()
+            children = [target.children[0] if target.children else target]
+        else:
+            children = ()
         
-        self._expect("SEPARATOR", ")")
+        self._expect(_SEP, "(")
+        arguments = self._parse_arguments()
+        self._expect(_SEP, ")")
         
-        return method_call
+        return MethodCall(
+            NodeType.METHOD_CALL,
+            pos,
+            method_name=method_name,
+            arguments=arguments,
+            children=children
+        )
 
     def _parse_new_expression(self):
         """Парсинг создания объекта или массива.
@@ -1672,21 +1717,21 @@ class Parser:
                         | 'new' type '[' expr ']'
         """
         pos = self._current_position()
-        self._expect("KEYWORD", "new")
+        self._expect(_KW, "new")
         
         # Парсим тип (int, String, MyClass и т.д.)
-        if not self.current_token:
-            raise UnexpectedTokenError("тип", "EOF", pos.line, pos.column)
+        if self.pos >= self.n:
+            raise UnexpectedTokenError("тип", _EOF, pos.line, pos.column)
         
-        type_name = self.current_token.lexeme
+        type_name = self.lexemes[self.pos]
         type_pos = self._current_position()
         self._advance()
         
         # Создание массива: new int[10]
-        if self._match("SEPARATOR", "["):
+        if self._match(_SEP, "["):
             self._advance()
             size = self._parse_expression()
-            self._expect("SEPARATOR", "]")
+            self._expect(_SEP, "]")
             
             # Используем правильный класс ArrayCreation
             element_type = Type(NodeType.TYPE, type_pos, name=type_name)
@@ -1700,20 +1745,9 @@ class Parser:
         # Создание объекта: new MyClass()
         class_type = Type(NodeType.TYPE, type_pos, name=type_name)
         
-        self._expect("SEPARATOR", "(")
-        
-        arguments = []
-        if not self._match("SEPARATOR", ")"):
-            while True:
-                arg = self._parse_expression()
-                if arg:
-                    arguments.append(arg)
-                
-                if not self._match("SEPARATOR", ","):
-                    break
-                self._advance()
-        
-        self._expect("SEPARATOR", ")")
+        self._expect(_SEP, "(")
+        arguments = self._parse_arguments()
+        self._expect(_SEP, ")")
         
         # Используем правильный класс ObjectCreation
         return ObjectCreation(
@@ -1726,27 +1760,18 @@ class Parser:
     def _parse_throw_statement(self) -> ThrowStatement:
         """Парсинг throw."""
         pos = self._current_position()
-        self._expect("KEYWORD", "throw")
-        
-        print(f"[DEBUG] throw: current_token = {self.current_token}")
+        self._expect(_KW, "throw")
         
         # Выражение (обычно new Exception(...) или переменная)
         expression = self._parse_expression()
         
-        print(f"[DEBUG] throw: expression = {expression}")
-        print(f"[DEBUG] throw: expression type = {type(expression)}")
-        
-        self._expect("SEPARATOR", ";")
+        self._expect(_SEP, ";")
         
-        result = ThrowStatement(
+        return ThrowStatement(
             node_type=NodeType.THROW_STATEMENT,
             position=pos,
             expression=expression
         )
-        
-        print(f"[DEBUG] throw: result.expression = {result.expression}")
-        
-        return result
 
     def _parse_do_while_statement(self):
         """Парсинг do-while.
@@ -1757,23 +1782,20 @@ class Parser:
         - children[1]: Expression - условие
         """
         pos = self._current_position()
-        self._expect("KEYWORD", "do")
+        self._expect(_KW, "do")
         
         # Тело цикла
         body = self._parse_statement()
         
         # while (condition)
-        self._expect("KEYWORD", "while")
-        self._expect("SEPARATOR", "(")
+        self._expect(_KW, "while")
+        self._expect(_SEP, "(")
         condition = self._parse_expression()
-        self._expect("SEPARATOR", ")")
-        self._expect("SEPARATOR", ";")
+        self._expect(_SEP, ")")
+        self._expect(_SEP, ";")
         
-        do_while_node = DoWhileStatement(NodeType.DO_WHILE_STATEMENT, pos)
-        do_while_node.add_child(body)
-        do_while_node.add_child(condition)
-        
-        return do_while_node
+        return DoWhileStatement(NodeType.DO_WHILE_STATEMENT, pos,
+                                children=[body, condition])
     def _parse_break_statement(self):
         """Парсинг break.
         
@@ -1784,15 +1806,15 @@ class Parser:
         - break label;  (для выхода из помеченного цикла)
         """
         pos = self._current_position()
-        self._expect("KEYWORD", "break")
+        self._expect(_KW, "break")
         
         # Опциональная метка
         label = None
-        if self._match("IDENTIFIER"):
-            label = self.current_token.lexeme
+        if self._match(_IDENT):
+            label = self.lexemes[self.pos]
             self._advance()
         
-        self._expect("SEPARATOR", ";")
+        self._expect(_SEP, ";")
         
         return BreakStatement(NodeType.BREAK_STATEMENT, pos, label=label)
     def _parse_continue_statement(self):
@@ -1805,15 +1827,15 @@ class Parser:
         - continue label;  (для продолжения помеченного цикла)
         """
         pos = self._current_position()
-        self._expect("KEYWORD", "continue")
+        self._expect(_KW, "continue")
         
         # Опциональная метка
         label = None
-        if self._match("IDENTIFIER"):
-            label = self.current_token.lexeme
+        if self._match(_IDENT):
+            label = self.lexemes[self.pos]
             self._advance()
         
-        self._expect("SEPARATOR", ";")
+        self._expect(_SEP, ";")
         
         return ContinueStatement(NodeType.CONTINUE_STATEMENT, pos, label=label)
     def _parse_try_statement(self) -> TryStatement:
@@ -1830,20 +1852,20 @@ class Parser:
             try { ... } catch (Exception e) { ... } finally { ... }
         """
         pos = self._current_position()
-        self._expect("KEYWORD", "try")
+        self._expect(_KW, "try")
         
         # Блок try
         try_block = self._parse_block()
         
         # Список catch clauses
         catch_clauses = []
-        while self._match("KEYWORD", "catch"):
+        while self._match(_KW, "catch"):
             catch_clause = self._parse_catch_clause()
             catch_clauses.append(catch_clause)
         
         # Опциональный finally
         finally_block = None
-        if self._match("KEYWORD", "finally"):
+        if self._match(_KW, "finally"):
             self._advance()
             finally_block = self._parse_block()
         
@@ -1871,16 +1893,16 @@ class Parser:
         Пример: catch (IOException e) { ... }
         """
         pos = self._current_position()
-        self._expect("KEYWORD", "catch")
-        self._expect("SEPARATOR", "(")
+        self._expect(_KW, "catch")
+        self._expect(_SEP, "(")
         
         # Тип исключения
         exception_type = self._parse_type()
         
         # Имя переменной
-        exception_name = self._expect("IDENTIFIER").lexeme
+        exception_name = self._expect(_IDENT)
         
-        self._expect("SEPARATOR", ")")
+        self._expect(_SEP, ")")
         
         # Тело catch
         body = self._parse_block()
@@ -1892,3 +1914,18 @@ class Parser:
             exception_name=exception_name,
             body=body
         )
+
+    # Таблица диспетчеризации инструкций: ключевое слово -> метод.
+    # Определяется в конце класса, когда все обработчики уже существуют.
+    _STMT_DISPATCH = {
+        "return": _parse_return_statement,
+        "throw": _parse_throw_statement,
+        "if": _parse_if_statement,
+        "try": _parse_try_statement,
+        "while": _parse_while_statement,
+        "do": _parse_do_while_statement,
+        "for": _parse_for_statement,
+        "switch": _parse_switch_statement,
+        "break": _parse_break_statement,
+        "continue": _parse_continue_statement,
+    }
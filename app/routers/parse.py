@@ -5,7 +5,7 @@ from app.models import ParseRequest, ParseResponse
 from app.javaparser import Parser
 from app.javaparser.errors import ParseError
 from app.javaparser.ast import (
-    ASTNode, Program, ClassDeclaration, MethodDeclaration, FieldDeclaration,
+    ASTNode, NodeType, Program, ClassDeclaration, MethodDeclaration, FieldDeclaration,
     VariableDeclaration, Type, BinaryOperation, Assignment, Literal, Identifier,
     MethodCall, Block, Parameter, UnaryOperation,
     TernaryOperation, BreakStatement, ContinueStatement, DoWhileStatement,
@@ -59,258 +59,277 @@ def parse_java(req: ParseRequest):
         )
 
 
+# ========== Сериализация AST ==========
+#
+# Диспетчеризация по IntEnum-тегу узла: один поиск в dict вместо цепочки
+# isinstance (обход MRO на каждый узел). Обработчик дозаполняет базовый
+# словарь result полями своего типа узла.
+
+_HANDLERS: Dict[int, Any] = {}
+
+
+def _handler(node_type):
+    def register(fn):
+        _HANDLERS[node_type] = fn
+        return fn
+    return register
+
+
 def ast_to_dict(node: Optional[ASTNode]) -> Optional[Dict[str, Any]]:
     """Convert AST node to dictionary for JSON serialization."""
     if node is None:
         return None
-    
+
     # Базовые поля для всех узлов
     result: Dict[str, Any] = {
-        "node_type": node.node_type.value if hasattr(node.node_type, 'value') else str(node.node_type),
+        "node_type": node.node_type.label if hasattr(node.node_type, 'label') else str(node.node_type),
         "position": {
             "line": node.position.line,
             "column": node.position.column
         }
     }
-    
-    # ========== Обработка по типам ==========
-    
-    # ============ NEW: ConstructorDeclaration ============
-    if isinstance(node, ConstructorDeclaration):
-        result["name"] = node.name
-        result["modifiers"] = node.modifiers
-        result["parameters"] = [ast_to_dict(p) for p in node.parameters]
-        result["body"] = ast_to_dict(node.body)
-        if node.throws:
-            result["throws"] = [ast_to_dict(t) for t in node.throws]
-        return result
-    
-    if isinstance(node, CastExpression):
-        result["target_type"] = ast_to_dict(node.target_type)
-        result["expression"] = ast_to_dict(node.expression)
-        return result
-    # ============ NEW: ThisCall ============
-    if isinstance(node, ThisCall):
-        result["arguments"] = [ast_to_dict(a) for a in node.arguments]
-        return result
-    
-    # ============ NEW: SuperCall ============
-    if isinstance(node, SuperCall):
-        result["arguments"] = [ast_to_dict(a) for a in node.arguments]
-        return result
-    # ============ SwitchStatement ============
-    if isinstance(node, SwitchStatement):
-        result["expression"] = ast_to_dict(node.expression)
-        result["cases"] = [ast_to_dict(c) for c in node.cases]
-        return result
 
-    # ============ SwitchCase ============
-    if isinstance(node, SwitchCase):
-        result["case_label"] = ast_to_dict(node.case_label)  # ПЕРЕИМЕНОВАНО
-        result["statements"] = [ast_to_dict(s) for s in node.statements]
-        result["is_default"] = node.is_default
-        return result
-    # ============ ArrayCreation ============
-    if isinstance(node, ArrayCreation):
-        result["element_type"] = ast_to_dict(node.element_type)
-        result["size"] = ast_to_dict(node.size)
-        if node.name:
-            result["name"] = node.name
-        if node.children:
-            result["children"] = [ast_to_dict(c) for c in node.children]
-        return result
-    
-    # ============ ObjectCreation ============
-    if isinstance(node, ObjectCreation):
-        result["class_type"] = ast_to_dict(node.class_type)
-        result["arguments"] = [ast_to_dict(arg) for arg in node.arguments]
-        if node.name:
-            result["name"] = node.name
-        return result
-    
-    # ============ TryStatement ============
-    if isinstance(node, TryStatement):
-        result["try_block"] = ast_to_dict(node.try_block)
-        result["catch_clauses"] = [ast_to_dict(c) for c in node.catch_clauses]
-        if node.finally_block:
-            result["finally_block"] = ast_to_dict(node.finally_block)
+    handler = _HANDLERS.get(node.node_type)
+    if handler is not None:
+        handler(node, result)
         return result
 
-    # ============ CatchClause ============
-    if isinstance(node, CatchClause):
-        result["exception_type"] = ast_to_dict(node.exception_type)
-        result["exception_name"] = node.exception_name
-        result["body"] = ast_to_dict(node.body)
-        return result
-    
-    # ============ ArrayAccess ============
-    if isinstance(node, ArrayAccess):
-        result["array"] = ast_to_dict(node.array)
-        result["index"] = ast_to_dict(node.index)
-        return result
-    
-    # BinaryOperation
-    if isinstance(node, BinaryOperation):
-        result["operator"] = node.operator
-        result["left"] = ast_to_dict(node.left)
-        result["right"] = ast_to_dict(node.right)
-        return result
-    
-    # UnaryOperation
-    if isinstance(node, UnaryOperation):
-        result["operator"] = node.operator
-        result["operand"] = ast_to_dict(node.operand)
-        result["is_postfix"] = node.is_postfix
-        return result
-    
-    # Assignment
-    if isinstance(node, Assignment):
-        result["operator"] = node.operator
-        result["variable"] = ast_to_dict(node.variable)
-        result["value"] = ast_to_dict(node.value)
-        return result
-    
-    # Literal
-    if isinstance(node, Literal):
-        result["value"] = node.value
-        result["literal_type"] = node.literal_type
-        return result
-    
-    # Identifier
-    if isinstance(node, Identifier):
-        result["name"] = node.name
-        return result
-    
-    # Type
-    if isinstance(node, Type):
-        result["name"] = node.name
-        result["is_array"] = node.is_array
-        if node.generic_types:
-            result["generic_types"] = [ast_to_dict(g) for g in node.generic_types]
-        return result
-    
-    # Parameter
-    if isinstance(node, Parameter):
-        result["name"] = node.name
-        result["param_type"] = ast_to_dict(node.param_type)
-        return result
-    
-    # VariableDeclaration
-    if isinstance(node, VariableDeclaration):
-        result["name"] = node.name
-        result["var_type"] = ast_to_dict(node.var_type)
-        result["value"] = ast_to_dict(node.value)
-        result["modifiers"] = node.modifiers
-        return result
-    
-    # FieldDeclaration
-    if isinstance(node, FieldDeclaration):
-        result["name"] = node.name
-        result["field_type"] = ast_to_dict(node.field_type)
-        result["value"] = ast_to_dict(node.value)
-        result["modifiers"] = node.modifiers
-        return result
-    
-    # ThrowStatement
-    if isinstance(node, ThrowStatement):
-        result["expression"] = ast_to_dict(node.expression)
-        return result
-    
-    # InstanceofExpression
-    if isinstance(node, InstanceofExpression):
-        result["expression"] = ast_to_dict(node.expression)
-        result["check_type"] = ast_to_dict(node.check_type)
-        return result
-    
-    # MethodCall
-    if isinstance(node, MethodCall):
-        result["method_name"] = node.method_name
-        result["arguments"] = [ast_to_dict(arg) for arg in node.arguments]
-        if node.target:
-            result["target"] = ast_to_dict(node.target)
-        if node.children:
-            result["children"] = [ast_to_dict(c) for c in node.children]
-        return result
-    
-    # Block
-    if isinstance(node, Block):
-        result["statements"] = [ast_to_dict(s) for s in node.statements]
-        return result
-    
-    # MethodDeclaration
-    if isinstance(node, MethodDeclaration):
-        result["name"] = node.name
-        result["modifiers"] = node.modifiers
-        result["return_type"] = ast_to_dict(node.return_type)
-        result["parameters"] = [ast_to_dict(p) for p in node.parameters]
-        result["body"] = ast_to_dict(node.body)
-        if node.throws:
-            result["throws"] = [ast_to_dict(t) for t in node.throws]
-        return result
-    
-    # TernaryOperation
-    if isinstance(node, TernaryOperation):
-        result["condition"] = ast_to_dict(node.condition)
-        result["then_expr"] = ast_to_dict(node.then_expr)
-        result["else_expr"] = ast_to_dict(node.else_expr)
-        return result
-    
-    # BreakStatement
-    if isinstance(node, BreakStatement):
-        if node.label:
-            result["label"] = node.label
-        return result
-    
-    # ContinueStatement
-    if isinstance(node, ContinueStatement):
-        if node.label:
-            result["label"] = node.label
-        return result
-    
-    # DoWhileStatement
-    if isinstance(node, DoWhileStatement):
-        if len(node.children) >= 1:
-            result["body"] = ast_to_dict(node.children[0])
-        if len(node.children) >= 2:
-            result["condition"] = ast_to_dict(node.children[1])
-        return result
-    
-    # ForEachStatement
-    if isinstance(node, ForEachStatement):
-        result["var_type"] = ast_to_dict(node.var_type)
-        result["var_name"] = node.var_name
-        result["iterable"] = ast_to_dict(node.iterable)
-        result["body"] = ast_to_dict(node.body)
-        return result
-    
-    # ClassDeclaration - UPDATED!
-    if isinstance(node, ClassDeclaration):
-        result["name"] = node.name
-        result["modifiers"] = node.modifiers
-        if node.extends:
-            result["extends"] = node.extends
-        if node.implements:
-            result["implements"] = node.implements
-        result["fields"] = [ast_to_dict(f) for f in node.fields]
-        result["methods"] = [ast_to_dict(m) for m in node.methods]
-        result["constructors"] = [ast_to_dict(c) for c in node.constructors]  # NEW!
-        if node.children:
-            result["children"] = [ast_to_dict(c) for c in node.children]
-        return result
-    
-    # Program
-    if isinstance(node, Program):
-        result["imports"] = node.imports
-        if node.package:
-            result["package"] = node.package
-        result["classes"] = [ast_to_dict(c) for c in node.classes]
-        return result
-    
     # ========== Общий случай: ASTNode ==========
     if hasattr(node, 'name') and node.name:
         result["name"] = node.name
-    
+
     if node.children:
         result["children"] = [ast_to_dict(c) for c in node.children]
-    
+
     return result
+
+
+@_handler(NodeType.CONSTRUCTOR_DECLARATION)
+def _ser_constructor(node, result):
+    result["name"] = node.name
+    result["modifiers"] = node.modifiers
+    result["parameters"] = [ast_to_dict(p) for p in node.parameters]
+    result["body"] = ast_to_dict(node.body)
+    if node.throws:
+        result["throws"] = [ast_to_dict(t) for t in node.throws]
+
+
+@_handler(NodeType.CAST_EXPRESSION)
+def _ser_cast(node, result):
+    result["target_type"] = ast_to_dict(node.target_type)
+    result["expression"] = ast_to_dict(node.expression)
+
+
+@_handler(NodeType.THIS_CALL)
+@_handler(NodeType.SUPER_CALL)
+def _ser_ctor_call(node, result):
+    result["arguments"] = [ast_to_dict(a) for a in node.arguments]
+
+
+@_handler(NodeType.SWITCH_STATEMENT)
+def _ser_switch(node, result):
+    result["expression"] = ast_to_dict(node.expression)
+    result["cases"] = [ast_to_dict(c) for c in node.cases]
+
+
+@_handler(NodeType.SWITCH_CASE)
+def _ser_switch_case(node, result):
+    result["case_label"] = ast_to_dict(node.case_label)
+    result["statements"] = [ast_to_dict(s) for s in node.statements]
+    result["is_default"] = node.is_default
+
+
+@_handler(NodeType.ARRAY_CREATION)
+def _ser_array_creation(node, result):
+    result["element_type"] = ast_to_dict(node.element_type)
+    result["size"] = ast_to_dict(node.size)
+    if node.name:
+        result["name"] = node.name
+    if node.children:
+        result["children"] = [ast_to_dict(c) for c in node.children]
+
+
+@_handler(NodeType.OBJECT_CREATION)
+def _ser_object_creation(node, result):
+    result["class_type"] = ast_to_dict(node.class_type)
+    result["arguments"] = [ast_to_dict(arg) for arg in node.arguments]
+    if node.name:
+        result["name"] = node.name
+
+
+@_handler(NodeType.TRY_STATEMENT)
+def _ser_try(node, result):
+    result["try_block"] = ast_to_dict(node.try_block)
+    result["catch_clauses"] = [ast_to_dict(c) for c in node.catch_clauses]
+    if node.finally_block:
+        result["finally_block"] = ast_to_dict(node.finally_block)
+
+
+@_handler(NodeType.CATCH_CLAUSE)
+def _ser_catch(node, result):
+    result["exception_type"] = ast_to_dict(node.exception_type)
+    result["exception_name"] = node.exception_name
+    result["body"] = ast_to_dict(node.body)
+
+
+@_handler(NodeType.ARRAY_ACCESS)
+def _ser_array_access(node, result):
+    result["array"] = ast_to_dict(node.array)
+    result["index"] = ast_to_dict(node.index)
+
+
+@_handler(NodeType.BINARY_OPERATION)
+def _ser_binary(node, result):
+    result["operator"] = node.operator
+    result["left"] = ast_to_dict(node.left)
+    result["right"] = ast_to_dict(node.right)
+
+
+@_handler(NodeType.UNARY_OPERATION)
+def _ser_unary(node, result):
+    result["operator"] = node.operator
+    result["operand"] = ast_to_dict(node.operand)
+    result["is_postfix"] = node.is_postfix
+
+
+@_handler(NodeType.ASSIGNMENT)
+def _ser_assignment(node, result):
+    result["operator"] = node.operator
+    result["variable"] = ast_to_dict(node.variable)
+    result["value"] = ast_to_dict(node.value)
+
+
+@_handler(NodeType.LITERAL)
+def _ser_literal(node, result):
+    result["value"] = node.value
+    result["literal_type"] = node.literal_type
+
+
+@_handler(NodeType.IDENTIFIER)
+def _ser_identifier(node, result):
+    # Парсер создаёт и «пустые» идентификаторы-заглушки (например, для
+    # опущенных секций for) — для них имя не сериализуем, как раньше.
+    if node.name:
+        result["name"] = node.name
+    if node.children:
+        result["children"] = [ast_to_dict(c) for c in node.children]
+
+
+@_handler(NodeType.TYPE)
+def _ser_type(node, result):
+    result["name"] = node.name
+    result["is_array"] = node.is_array
+    if node.generic_types:
+        result["generic_types"] = [ast_to_dict(g) for g in node.generic_types]
+
+
+@_handler(NodeType.PARAMETER)
+def _ser_parameter(node, result):
+    result["name"] = node.name
+    result["param_type"] = ast_to_dict(node.param_type)
+
+
+@_handler(NodeType.VARIABLE_DECLARATION)
+def _ser_variable(node, result):
+    result["name"] = node.name
+    result["var_type"] = ast_to_dict(node.var_type)
+    result["value"] = ast_to_dict(node.value)
+    result["modifiers"] = node.modifiers
+
+
+@_handler(NodeType.FIELD_DECLARATION)
+def _ser_field(node, result):
+    result["name"] = node.name
+    result["field_type"] = ast_to_dict(node.field_type)
+    result["value"] = ast_to_dict(node.value)
+    result["modifiers"] = node.modifiers
+
+
+@_handler(NodeType.THROW_STATEMENT)
+def _ser_throw(node, result):
+    result["expression"] = ast_to_dict(node.expression)
+
+
+@_handler(NodeType.INSTANCEOF_EXPRESSION)
+def _ser_instanceof(node, result):
+    result["expression"] = ast_to_dict(node.expression)
+    result["check_type"] = ast_to_dict(node.check_type)
+
+
+@_handler(NodeType.METHOD_CALL)
+def _ser_method_call(node, result):
+    result["method_name"] = node.method_name
+    result["arguments"] = [ast_to_dict(arg) for arg in node.arguments]
+    if node.target:
+        result["target"] = ast_to_dict(node.target)
+    if node.children:
+        result["children"] = [ast_to_dict(c) for c in node.children]
+
+
+@_handler(NodeType.BLOCK)
+def _ser_block(node, result):
+    result["statements"] = [ast_to_dict(s) for s in node.statements]
+
+
+@_handler(NodeType.METHOD_DECLARATION)
+def _ser_method(node, result):
+    result["name"] = node.name
+    result["modifiers"] = node.modifiers
+    result["return_type"] = ast_to_dict(node.return_type)
+    result["parameters"] = [ast_to_dict(p) for p in node.parameters]
+    result["body"] = ast_to_dict(node.body)
+    if node.throws:
+        result["throws"] = [ast_to_dict(t) for t in node.throws]
+
+
+@_handler(NodeType.TERNARY_OPERATION)
+def _ser_ternary(node, result):
+    result["condition"] = ast_to_dict(node.condition)
+    result["then_expr"] = ast_to_dict(node.then_expr)
+    result["else_expr"] = ast_to_dict(node.else_expr)
+
+
+@_handler(NodeType.BREAK_STATEMENT)
+@_handler(NodeType.CONTINUE_STATEMENT)
+def _ser_break_continue(node, result):
+    if node.label:
+        result["label"] = node.label
+
+
+@_handler(NodeType.DO_WHILE_STATEMENT)
+def _ser_do_while(node, result):
+    if len(node.children) >= 1:
+        result["body"] = ast_to_dict(node.children[0])
+    if len(node.children) >= 2:
+        result["condition"] = ast_to_dict(node.children[1])
+
+
+@_handler(NodeType.FOR_EACH_STATEMENT)
+def _ser_for_each(node, result):
+    result["var_type"] = ast_to_dict(node.var_type)
+    result["var_name"] = node.var_name
+    result["iterable"] = ast_to_dict(node.iterable)
+    result["body"] = ast_to_dict(node.body)
+
+
+@_handler(NodeType.CLASS_DECLARATION)
+def _ser_class(node, result):
+    result["name"] = node.name
+    result["modifiers"] = node.modifiers
+    if node.extends:
+        result["extends"] = node.extends
+    if node.implements:
+        result["implements"] = node.implements
+    result["fields"] = [ast_to_dict(f) for f in node.fields]
+    result["methods"] = [ast_to_dict(m) for m in node.methods]
+    result["constructors"] = [ast_to_dict(c) for c in node.constructors]
+    if node.children:
+        result["children"] = [ast_to_dict(c) for c in node.children]
+
+
+@_handler(NodeType.PROGRAM)
+def _ser_program(node, result):
+    result["imports"] = node.imports
+    if node.package:
+        result["package"] = node.package
+    result["classes"] = [ast_to_dict(c) for c in node.classes]
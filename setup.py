@@ -0,0 +1,33 @@
+"""Опциональная сборка парсера как C-расширения через Cython.
+
+Модули остаются обычными .py и работают без компиляции; если Cython
+установлен, `python setup.py build_ext --inplace` собирает горячие
+модули (ast, parser, errors) в нативные расширения.
+"""
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize(
+        [
+            "app/javaparser/ast.py",
+            "app/javaparser/errors.py",
+            "app/javaparser/parser.py",
+        ],
+        language_level=3,
+        compiler_directives={
+            "boundscheck": False,
+            "wraparound": False,
+            "initializedcheck": False,
+        },
+    )
+
+setup(
+    name="java-parser-web",
+    version="1.0.0",
+    packages=["app", "app.javaparser", "app.routers"],
+    ext_modules=ext_modules,
+)
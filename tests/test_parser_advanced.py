@@ -233,7 +233,7 @@ class TestErrorHandling:
         
         # Проверяем что парсинг завершился
         assert result is not None
-        assert result.node_type.value == "Program"
+        assert result.node_type.label == "Program"
     
     def test_missing_closing_brace(self, parse, make_token):
         """class A { (missing }) — должен вызвать ошибку."""
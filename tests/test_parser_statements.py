@@ -250,7 +250,7 @@ class TestReturnStatement:
         
         stmt = result.classes[0].methods[0].body.statements[0]
         assert stmt.node_type == NodeType.RETURN_STATEMENT
-        assert stmt.children == []
+        assert not stmt.children
     
     def test_return_value(self, parse, class_wrapper, make_token):
         """return 42;"""